@@ -17,7 +17,7 @@ from .config import Settings, get_settings
 from .donation.ingestor import DonationIngestor
 from .llm import LLMOrchestrator, LLMPlanError
 from .logging import configure_logging
-from .models import DonationEvent, RenderTask, RenderTaskType
+from .models import DonationEvent, RenderTask, RenderTaskType, to_minor_units
 from .queue import QueueManager
 from .renderer.runtime import RendererRuntime
 
@@ -111,7 +111,7 @@ class DrawStreamApp:
             id=str(uuid4()),
             donor=donor,
             message=message,
-            amount=amount,
+            amount_minor=to_minor_units(amount, currency),
             currency=currency,
             timestamp=datetime.now(timezone.utc),
         )
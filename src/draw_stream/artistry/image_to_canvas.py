@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-import itertools
-from collections import Counter
-from typing import List
-
+import numpy as np
 from PIL import Image
 
 from ..canvas_dsl import CanvasDocument, ensure_canvas_document
@@ -35,17 +32,16 @@ class ImageToCanvas:
         resized = image.resize((self._size, self._size), Image.NEAREST)
         quantized = resized.quantize(colors=self._palette_colors, method=Image.MEDIANCUT)
         palette = self._extract_palette(quantized)
-        data = list(quantized.getdata())
-        width, height = quantized.size
-
-        counts = Counter(data)
-        if not counts:
+        # Palette index per pixel, row-major; all per-colour work below runs on this plane.
+        indices = np.asarray(quantized)
+        if not indices.size:
             raise ValueError("Quantized image contains no data")
-        bg_index = counts.most_common(1)[0][0]
+
+        ordered_indices = self._indices_by_frequency(indices)
+        bg_index = ordered_indices[0]
 
         steps = []
         debug_layers = []
-        ordered_indices = [idx for idx, _ in counts.most_common()]
         delay = 0
         order_counter = 0
         for idx in ordered_indices:
@@ -54,7 +50,7 @@ class ImageToCanvas:
             color_hex = palette.get(idx)
             if not color_hex:
                 continue
-            points = self._collect_points(data, width, height, idx)
+            points = self._collect_points(indices, idx)
             if not points:
                 continue
             for stroke in self._chunk_points(points):
@@ -90,35 +86,38 @@ class ImageToCanvas:
                 "h": self._size,
                 "bg": palette.get(bg_index, "#000000"),
             },
-            "palette": self._ordered_palette(palette, counts),
+            "palette": self._ordered_palette(palette, ordered_indices),
             "steps": steps,
         }
         return ensure_canvas_document(document), debug_layers if return_debug else None
 
-    def _collect_points(self, data: List[int], width: int, height: int, target_idx: int) -> list[list[int]]:
-        points: list[list[int]] = []
-        for y in range(height):
-            row_offset = y * width
-            for x in range(width):
-                if data[row_offset + x] == target_idx:
-                    points.append([x, y])
-        return points
+    @staticmethod
+    def _indices_by_frequency(indices: np.ndarray) -> list[int]:
+        """Palette indices present in ``indices``, most frequent first.
+
+        Ties keep first-appearance order, as ``Counter.most_common`` did.
+        """
+
+        flat = indices.ravel()
+        counts = np.bincount(flat)
+        present, first_seen = np.unique(flat, return_index=True)
+        order = np.lexsort((first_seen, -counts[present]))
+        return present[order].tolist()
+
+    def _collect_points(self, indices: np.ndarray, target_idx: int) -> list[list[int]]:
+        ys, xs = np.nonzero(indices == target_idx)
+        return np.column_stack((xs, ys)).tolist()
 
     def _chunk_points(self, points: list[list[int]]) -> list[list[list[int]]]:
-        if not points:
-            return []
-        ordered = sorted(points, key=lambda pt: (pt[1], pt[0]))
-        strokes: list[list[list[int]]] = []
-        for i in range(0, len(ordered), self._chunk_size):
-            strokes.append(ordered[i : i + self._chunk_size])
-        return strokes
+        # _collect_points yields row-major order already, so strokes are plain slices.
+        return [points[i : i + self._chunk_size] for i in range(0, len(points), self._chunk_size)]
 
     def _stroke_duration(self, pixels: int) -> int:
         return int(self._base_duration + pixels * self._per_pixel)
 
-    def _ordered_palette(self, palette_map: dict[int, str], counts: Counter) -> list[str]:
+    def _ordered_palette(self, palette_map: dict[int, str], ordered_indices: list[int]) -> list[str]:
         ordered: list[str] = []
-        for idx, _ in counts.most_common():
+        for idx in ordered_indices:
             color = palette_map.get(idx)
             if color and color not in ordered:
                 ordered.append(color)
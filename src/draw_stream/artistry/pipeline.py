@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import subprocess
 
 from ..config import LLMBackend, get_settings
 from ..models import DonationEvent, SceneDescription, ScenePlan
@@ -32,23 +31,50 @@ class ArtPipeline:
         self._scene_planner = scene_planner or ScenePlanner()
         self._pixel_generator = pixel_generator or PixelArtGenerator()
         self._canvas_builder = canvas_builder or ImageToCanvas()
+        # Finished documents by normalized message, in least-recently-used order.
+        self._plan_cache: dict[str, CanvasDocument] = {}
 
     async def create_plan(self, event: DonationEvent):
+        key = self._plan_cache_key(event.message)
+        cached = self._plan_cache.pop(key, None) if key else None
+        if cached is not None:
+            # A repeated message skips the LLM and the diffusion run entirely.
+            self._plan_cache[key] = cached
+            logger.info("plan.cached", extra={"id": event.id})
+            return cached.model_copy(deep=True)
+
+        document, cacheable = await self._build_plan(event)
+        limit = self._settings.plan_cache_size
+        if key and cacheable and limit > 0:
+            if len(self._plan_cache) >= limit:
+                self._plan_cache.pop(next(iter(self._plan_cache)))
+            # The caller gets its own copy on hits too, so later mutations never reach the cache.
+            self._plan_cache[key] = document.model_copy(deep=True)
+        return document
+
+    async def _build_plan(self, event: DonationEvent) -> tuple[CanvasDocument, bool]:
+        """Return the document for ``event`` and whether it may be cached."""
+
         try:
             scene_plan = await self._scene_planner.describe(event)
             logger.info("scene.planned", extra={"id": event.id})
+            cacheable = True
         except ScenePlannerError as exc:
             logger.info("scene.fallback", extra={"id": event.id, "error": str(exc)})
             scene_plan = self._fallback_plan(event)
+            # Planner failures are usually transient; the next identical message retries the LLM.
+            cacheable = False
 
         if not scene_plan.approved or not scene_plan.description:
             text = scene_plan.fallback_text or scene_plan.reason or "Request was declined"
             logger.info("scene.rejected", extra={"id": event.id, "reason": scene_plan.reason})
-            return self._text_document(text)
+            return self._text_document(text), cacheable
 
         scene_description = scene_plan.description
 
-        self._free_llm_vram()
+        # Diffusion deliberately waits for the whole planner response: the decision field can
+        # still reject the request, and the LLM has to leave VRAM before SDXL can run.
+        await self._free_llm_vram()
 
         try:
             image = await self._pixel_generator.generate(scene_description)
@@ -60,11 +86,15 @@ class ArtPipeline:
         except Exception as exc:  # pragma: no cover
             raise ArtPipelineError("Canvas conversion failed") from exc
 
-        return document
+        return document, cacheable
 
     async def aclose(self) -> None:
         await self._scene_planner.aclose()
 
+    @staticmethod
+    def _plan_cache_key(message: str | None) -> str:
+        return " ".join((message or "").casefold().split())
+
     def _fallback_plan(self, event: DonationEvent) -> ScenePlan:
         prompt = (
             f"Pixel art illustration of: {event.message}. "
@@ -81,13 +111,9 @@ class ArtPipeline:
             render_text=message,
         )
 
-    def _free_llm_vram(self) -> None:
-        settings = self._settings
-        if settings.llm_backend == LLMBackend.OLLAMA:
-            try:
-                subprocess.run(["ollama", "stop", settings.llm_model_id], check=False)
-            except FileNotFoundError:  # pragma: no cover - optional dependency
-                pass
+    async def _free_llm_vram(self) -> None:
+        if self._settings.llm_backend == LLMBackend.OLLAMA:
+            await self._scene_planner.unload_model()
 
         try:
             import torch
@@ -61,6 +61,9 @@ class PixelArtGenerator:
             )
         self._pipe.to(self._device, dtype=dtype)
         self._pipe.set_progress_bar_config(disable=True)
+        # Every request renders at the same configured size, so cuDNN's autotuned kernels
+        # from the first image are reused for all later ones.
+        torch.backends.cudnn.benchmark = True
 
     async def generate(self, description: SceneDescription) -> Image.Image:
         loop = asyncio.get_running_loop()
@@ -123,11 +123,29 @@ class ScenePlanner:
     def __init__(self, settings: Optional[Settings] = None, client: Optional[httpx.AsyncClient] = None) -> None:
         self._settings = settings or get_settings()
         timeout = httpx.Timeout(self._settings.llm_timeout_sec)
-        self._client = client or httpx.AsyncClient(timeout=timeout)
+        # Requests are spaced out by image generation, which outlasts httpx's default 5 s idle
+        # expiry; keep the pooled connection long enough to be reused by the next request.
+        limits = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)
+        self._client = client or httpx.AsyncClient(timeout=timeout, limits=limits)
 
     async def aclose(self) -> None:
         await self._client.aclose()
 
+    async def unload_model(self) -> None:
+        """Ask Ollama to evict the model now rather than when its keep-alive window ends.
+
+        A generate request with ``keep_alive: 0`` is what ``ollama stop`` sends; issuing it
+        here reuses the pooled connection instead of spawning the CLI.
+        """
+
+        url = httpx.URL(str(self._settings.llm_endpoint)).join("/api/generate")
+        payload = {"model": self._settings.llm_model_id, "keep_alive": 0}
+        try:
+            response = await self._client.post(url, json=payload)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:  # pragma: no cover - network failure
+            logger.warning("scene.unload_failed", extra={"error": str(exc)})
+
     async def describe(self, event: DonationEvent) -> ScenePlan:
         messages = [
             {"role": "system", "content": SCENE_SYSTEM_PROMPT},
@@ -58,6 +58,7 @@ class Settings(BaseSettings):
     llm_max_tokens: int = Field(1536, alias="LLM_MAX_TOKENS")
     llm_timeout_sec: float = Field(30.0, alias="LLM_TIMEOUT_SEC")
     llm_retry_attempts: int = Field(3, alias="LLM_RETRY_ATTEMPTS")
+    plan_cache_size: int = Field(32, alias="PLAN_CACHE_SIZE")
 
     # Renderer
     canvas_w: int = Field(96, alias="CANVAS_W")
@@ -138,6 +139,13 @@ class Settings(BaseSettings):
             raise ValueError("Retry attempts must be non-negative")
         return value
 
+    @field_validator("plan_cache_size")
+    @classmethod
+    def _ensure_cache_size(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("Plan cache size must be non-negative")
+        return value
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Iterable, Optional
 
 import httpx
 
 from ..config import Settings, get_settings
-from ..models import DonationEvent
+from ..models import DonationEvent, to_minor_units
 
 
 def _parse_timestamp(raw: str) -> datetime:
@@ -51,8 +50,8 @@ class DonationAlertsRESTClient:
     def _normalize_item(self, item: dict) -> DonationEvent:
         donor = item.get("username") or item.get("name") or item.get("nickname")
         amount_val = item.get("amount_main") or item.get("amount") or 0
-        amount = Decimal(str(amount_val))
         currency = self._settings.display_currency
+        amount_minor = to_minor_units(amount_val, currency)
         message = item.get("message") or ""
         timestamp_raw = item.get("created_at") or item.get("date_created")
         if not timestamp_raw:
@@ -62,7 +61,7 @@ class DonationAlertsRESTClient:
             id=str(item.get("id")),
             donor=donor,
             message=message,
-            amount=amount,
+            amount_minor=amount_minor,
             currency=currency,
             timestamp=timestamp,
         )
@@ -7,14 +7,13 @@ import json
 import logging
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 import websockets
 from websockets.client import WebSocketClientProtocol
 
 from ..config import Settings, get_settings
-from ..models import DonationEvent
+from ..models import DonationEvent, to_minor_units
 
 logger = logging.getLogger(__name__)
 
@@ -80,13 +79,15 @@ class DonationAlertsWebSocket:
         if "data" in data:
             data = data["data"]
 
+        currency = self._settings.display_currency
         try:
+            amount_raw = data.get("amount_main") or data.get("amount") or 0
             return DonationEvent(
                 id=str(data["id"]),
                 donor=data.get("username") or data.get("name") or data.get("nickname"),
                 message=data.get("message") or "",
-                amount=Decimal(str(data.get("amount_main") or data.get("amount") or 0)),
-                currency=self._settings.display_currency,
+                amount_minor=to_minor_units(amount_raw, currency),
+                currency=currency,
                 timestamp=self._parse_timestamp(data.get("created_at") or data.get("date_created")),
             )
         except (KeyError, TypeError, ValueError) as exc:
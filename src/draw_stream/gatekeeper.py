@@ -18,6 +18,33 @@ DEFAULT_RULES = (
 )
 
 
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _combine(rules: Iterable[str]) -> Pattern[str] | None:
+    """Join ``rules`` into one alternation so a clean message is scanned once.
+
+    Leading global flags such as ``(?i)`` become scoped groups, since Python only
+    accepts global flags at the very start of a pattern. Returns ``None`` when the
+    rules cannot share a pattern: backreferences would point at another rule's groups.
+    """
+
+    parts = []
+    for rule in rules:
+        if _BACKREFERENCE.search(rule):
+            return None
+        flags = _GLOBAL_FLAGS.match(rule)
+        if flags:
+            parts.append(f"(?{flags.group(1)}:{rule[flags.end():]})")
+        else:
+            parts.append(f"(?:{rule})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
 @dataclass(slots=True)
 class GatekeeperDecision:
     """Result of gatekeeper evaluation."""
@@ -31,10 +58,14 @@ class Gatekeeper:
 
     def __init__(self, rules: Iterable[str] | None = None) -> None:
         self._patterns: tuple[Pattern[str], ...] = tuple(re.compile(rule) for rule in (rules or DEFAULT_RULES))
+        self._combined = _combine(pattern.pattern for pattern in self._patterns)
 
     def evaluate(self, event: DonationEvent) -> GatekeeperDecision:
         """Return whether the donation message is considered NSFW."""
 
+        if self._combined is not None and not self._combined.search(event.message):
+            return GatekeeperDecision(nsfw=False)
+        # Rare path: find which rule fired, keeping the first-rule-wins reporting.
         for pattern in self._patterns:
             if pattern.search(event.message):
                 return GatekeeperDecision(nsfw=True, rule=pattern.pattern)
@@ -4,25 +4,82 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation, Overflow
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from .canvas_dsl import CanvasDocument
 
 
+# ISO 4217 currencies whose minor unit is not a hundredth of the major unit.
+_CURRENCY_EXPONENTS = {
+    **dict.fromkeys(("BHD", "IQD", "JOD", "KWD", "LYD", "OMR", "TND"), 3),
+    **dict.fromkeys(
+        (
+            "BIF", "CLP", "DJF", "GNF", "ISK", "JPY", "KMF", "KRW",
+            "PYG", "RWF", "UGX", "VND", "VUV", "XAF", "XOF", "XPF",
+        ),
+        0,
+    ),
+}
+
+
+def currency_exponent(currency: str) -> int:
+    """Return the number of minor-unit digits of ``currency`` (2 unless listed otherwise)."""
+
+    return _CURRENCY_EXPONENTS.get(currency.upper(), 2)
+
+
+def to_minor_units(value: Decimal | str | int | float, currency: str) -> int:
+    """Convert a major-unit amount (e.g. ``"5.00"`` USD) into integer minor units (``500``)."""
+
+    try:
+        amount = value if isinstance(value, Decimal) else Decimal(str(value))
+        if not amount.is_finite():
+            raise ValueError(f"Amount must be finite, got {value!r}")
+        scaled = amount.scaleb(currency_exponent(currency))
+        minor = int(scaled.to_integral_value(rounding=ROUND_HALF_UP))
+    except (InvalidOperation, Overflow, OverflowError) as exc:
+        # Decimal signals are ArithmeticErrors; callers and pydantic expect a ValueError.
+        raise ValueError(f"Invalid amount {value!r}") from exc
+    if amount > 0 and minor == 0:
+        raise ValueError(f"Amount {value!r} is below the smallest {currency} unit")
+    return minor
+
+
 class DonationEvent(BaseModel):
-    """Normalized donation payload."""
+    """Normalized donation payload.
+
+    The amount is stored as an integer number of minor units of ``currency``
+    (cents for USD, yen for JPY) so events stay cheap to validate and hash;
+    ``amount`` is still accepted on input and exposed as a ``Decimal``
+    property for display.
+    """
 
     id: str = Field(..., description="Donation identifier supplied by Donation Alerts")
     donor: Optional[str] = Field(default=None, description="Display name of the donor")
     message: str = Field(default="", description="Raw donor message")
-    amount: Decimal = Field(..., description="Donation amount")
+    amount_minor: int = Field(..., description="Donation amount in minor units of ``currency``")
     currency: str = Field(..., description="Currency code (ISO 4217)")
     timestamp: datetime = Field(..., description="Donation creation timestamp (UTC)")
 
+    @model_validator(mode="before")
+    @classmethod
+    def _convert_amount(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "amount" in data:
+            data = dict(data)
+            amount = data.pop("amount")
+            data.setdefault("amount_minor", to_minor_units(amount, str(data.get("currency") or "")))
+        return data
+
+    @property
+    def amount(self) -> Decimal:
+        """Donation amount in major units at the currency's precision, e.g. ``Decimal("5.00")``."""
+
+        return Decimal(self.amount_minor).scaleb(-currency_exponent(self.currency))
+
 
 class RenderTaskType(str, Enum):
     """Render task variants."""
@@ -3,84 +3,108 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 from collections import deque
 from typing import Deque, Iterable, Optional
 
-from asyncio import QueueEmpty
-
 from .models import RenderTask
 
 
 class QueueManager:
-    """FIFO queue with preview support backed by asyncio primitives."""
+    """FIFO queue with preview support backed by asyncio primitives.
+
+    Tasks live in a single deque guarded by a condition, which doubles as the
+    preview source. Nothing awaits ``join()`` on the render queue, so the
+    ``task_done`` bookkeeping of ``asyncio.Queue`` is not carried along.
+    """
 
     def __init__(self, max_size: int, preview_size: int = 5) -> None:
-        self._queue: asyncio.Queue[RenderTask] = asyncio.Queue(max_size)
-        self._backing: Deque[RenderTask] = deque()
+        self._tasks: Deque[RenderTask] = deque()
+        self._max_size = max_size
         self._preview_size = preview_size
-        self._lock = asyncio.Lock()
+        self._changed = asyncio.Condition()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation, letting pollers skip unchanged previews."""
+
+        return self._version
+
+    def _has_room(self) -> bool:
+        return self._max_size <= 0 or len(self._tasks) < self._max_size
 
     async def enqueue(self, task: RenderTask) -> None:
         """Put a task into the queue, blocking if at capacity."""
 
-        await self._queue.put(task)
-        async with self._lock:
-            self._backing.append(task)
+        async with self._changed:
+            await self._changed.wait_for(self._has_room)
+            self._tasks.append(task)
+            self._version += 1
+            self._changed.notify_all()
+
+    async def enqueue_many(self, tasks: Iterable[RenderTask]) -> None:
+        """Put several tasks in FIFO order under one lock acquisition, waiting for room as needed."""
+
+        async with self._changed:
+            for task in tasks:
+                if not self._has_room():
+                    # Wake consumers for what is queued so far before waiting for them.
+                    self._changed.notify_all()
+                    await self._changed.wait_for(self._has_room)
+                self._tasks.append(task)
+                self._version += 1
+            self._changed.notify_all()
 
     async def dequeue(self) -> RenderTask:
         """Retrieve the next task in FIFO order."""
 
-        task = await self._queue.get()
-        async with self._lock:
-            try:
-                self._backing.remove(task)
-            except ValueError:  # pragma: no cover - should not occur
-                self._backing.clear()
+        async with self._changed:
+            await self._changed.wait_for(lambda: bool(self._tasks))
+            task = self._tasks.popleft()
+            self._version += 1
+            self._changed.notify_all()
         return task
 
-    def task_done(self) -> None:
-        """Signal completion of the most recently dequeued task."""
+    async def dequeue_up_to(self, limit: int) -> list[RenderTask]:
+        """Wait for at least one task, then take up to ``limit`` tasks in FIFO order."""
 
-        self._queue.task_done()
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        async with self._changed:
+            await self._changed.wait_for(lambda: bool(self._tasks))
+            batch = [self._tasks.popleft() for _ in range(min(limit, len(self._tasks)))]
+            self._version += 1
+            self._changed.notify_all()
+        return batch
 
     async def clear(self) -> None:
         """Drop all queued (non-active) tasks."""
 
-        async with self._lock:
-            self._backing.clear()
-            while True:
-                try:
-                    self._queue.get_nowait()
-                except QueueEmpty:
-                    break
-                else:
-                    self._queue.task_done()
+        async with self._changed:
+            self._tasks.clear()
+            self._version += 1
+            self._changed.notify_all()
 
     async def drain(self) -> Iterable[RenderTask]:
         """Remove and return all queued tasks."""
 
-        drained: list[RenderTask] = []
-        async with self._lock:
-            while True:
-                try:
-                    task = self._queue.get_nowait()
-                except QueueEmpty:
-                    break
-                else:
-                    drained.append(task)
-                    self._queue.task_done()
-            self._backing.clear()
+        async with self._changed:
+            drained = list(self._tasks)
+            self._tasks.clear()
+            self._version += 1
+            self._changed.notify_all()
         return drained
 
     async def preview(self, limit: Optional[int] = None) -> list[RenderTask]:
         """Return up to ``limit`` queued tasks (without removing)."""
 
         limit = limit or self._preview_size
-        async with self._lock:
-            return list(self._backing)[:limit]
+        async with self._changed:
+            return list(itertools.islice(self._tasks, limit))
 
     async def size(self) -> int:
         """Return current queue length."""
 
-        async with self._lock:
-            return len(self._backing)
+        async with self._changed:
+            return len(self._tasks)
@@ -5,10 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pygame
 
 from ..canvas_dsl import (
     AnimationConfig,
+    CanvasDocument,
     CanvasSpec,
     CircleStep,
     LineStep,
@@ -21,6 +23,37 @@ from ..canvas_dsl import (
 )
 from .surface import create_canvas, hex_to_rgb
 
+_FONTS: dict[tuple[str, int], pygame.font.Font] = {}
+_NO_POINTS = np.empty(0, dtype=np.int32)
+
+
+def _get_font(name: str, size: int) -> pygame.font.Font:
+    """Return a cached ``SysFont``; font lookup scans the system font list."""
+
+    key = (name, size)
+    font = _FONTS.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _FONTS[key] = font
+    return font
+
+
+def _plot_pixels(
+    target: pygame.Surface, xs: np.ndarray, ys: np.ndarray, color: tuple[int, int, int]
+) -> None:
+    """Write ``color`` at every ``(xs[i], ys[i])`` with a single array store."""
+
+    pixels = pygame.surfarray.pixels2d(target)
+    pixels[xs, ys] = target.map_rgb(color) & 0xFFFFFFFF  # map_rgb may return a signed int
+    del pixels
+
+
+def _points_bbox(xs: np.ndarray, ys: np.ndarray) -> pygame.Rect:
+    if not len(xs):
+        return pygame.Rect(0, 0, 0, 0)
+    left, top = int(xs.min()), int(ys.min())
+    return pygame.Rect(left, top, int(xs.max()) - left + 1, int(ys.max()) - top + 1)
+
 
 @dataclass(slots=True)
 class StepTimeline:
@@ -33,38 +66,61 @@ class StepTimeline:
 
 @dataclass(slots=True)
 class PreparedStep:
-    """Prepared renderer step with static surface and metadata."""
+    """Prepared renderer step with static surface and metadata.
+
+    ``surface`` is ``None`` for pixel_reveal pixel steps, which plot their
+    points straight into the target. ``color`` is the parsed colour those
+    steps and solid rect fills write directly. ``bbox`` bounds every pixel
+    ``render`` or ``apply_final`` can change (``None`` means the whole canvas).
+    """
 
     step: CanvasStep
-    surface: pygame.Surface
+    surface: Optional[pygame.Surface]
     timeline: StepTimeline
-    points: list[tuple[int, int]]
+    xs: np.ndarray
+    ys: np.ndarray
+    fill_rect: Optional[pygame.Rect] = None
+    color: Optional[tuple[int, int, int]] = None
+    bbox: Optional[pygame.Rect] = None
 
     def render(self, target: pygame.Surface, progress: float) -> None:
         progress = max(0.0, min(1.0, progress))
 
         if isinstance(self.step, PixelsStep) and self.timeline.mode == "pixel_reveal":
-            total = len(self.points)
+            total = len(self.xs)
             count = max(1, int(total * progress))
-            color = hex_to_rgb(self.step.color)
-            for x, y in self.points[:count]:
-                target.set_at((x, y), color)
+            _plot_pixels(target, self.xs[:count], self.ys[:count], self.color)
             return
 
-        temp = self.surface.copy()
         alpha = int(255 * progress)
+        if self.fill_rect is not None:
+            # apply_final fills directly, so the rect-sized surface can be faded in place
+            self.surface.set_alpha(alpha)
+            target.blit(self.surface, self.fill_rect.topleft)
+            return
+
+        temp = self.surface.copy()
         temp.set_alpha(alpha)
         target.blit(temp, (0, 0))
 
     def apply_final(self, target: pygame.Surface) -> None:
         if isinstance(self.step, PixelsStep) and self.timeline.mode == "pixel_reveal":
-            color = hex_to_rgb(self.step.color)
-            for x, y in self.points:
-                target.set_at((x, y), color)
+            _plot_pixels(target, self.xs, self.ys, self.color)
+        elif self.fill_rect is not None:
+            target.fill(self.color, self.fill_rect)
         else:
             target.blit(self.surface, (0, 0))
 
 
+@dataclass(slots=True)
+class PreparedPlan:
+    """Prepared steps of a plan with their timelines laid out as parallel arrays."""
+
+    steps: list[PreparedStep]
+    delays_ms: np.ndarray
+    durations_ms: np.ndarray
+
+
 class StepPreparer:
     """Convert Canvas DSL steps into pygame surfaces and metadata."""
 
@@ -80,10 +136,72 @@ class StepPreparer:
             return prepared
         return [self._prepare_leaf(step)]
 
+    def prepare_plan(self, plan: CanvasDocument) -> PreparedPlan:
+        steps: list[PreparedStep] = []
+        for step in plan.steps or []:
+            steps.extend(self.prepare(step))
+
+        count = len(steps)
+        delays = np.fromiter(
+            (s.timeline.delay_ms for s in steps), dtype=np.int32, count=count
+        )
+        durations = np.fromiter(
+            (s.timeline.duration_ms for s in steps), dtype=np.int32, count=count
+        )
+        return PreparedPlan(steps=steps, delays_ms=delays, durations_ms=durations)
+
     def _prepare_leaf(self, step: CanvasStep) -> PreparedStep:
+        if self._is_solid_rect(step):
+            return self._prepare_fill_rect(step)
+
+        timeline = self._build_timeline(step)
+        xs = ys = _NO_POINTS
+        if isinstance(step, PixelsStep):
+            xs, ys = self._clip_points(step)
+            if timeline.mode == "pixel_reveal":
+                return PreparedStep(
+                    step=step,
+                    surface=None,
+                    timeline=timeline,
+                    xs=xs,
+                    ys=ys,
+                    color=hex_to_rgb(step.color),
+                    bbox=_points_bbox(xs, ys),
+                )
+
         surface = create_canvas(self._canvas.w, self._canvas.h)
-        points: list[tuple[int, int]] = []
+        self._draw_leaf(surface, step, xs, ys)
+        return PreparedStep(
+            step=step,
+            surface=surface,
+            timeline=timeline,
+            xs=xs,
+            ys=ys,
+            bbox=surface.get_bounding_rect(),
+        )
 
+    def apply(self, step: CanvasStep, target: pygame.Surface) -> None:
+        """Draw ``step`` in its final state straight onto ``target``.
+
+        For callers that only want the finished picture: no ``PreparedStep``, timeline
+        or per-step canvas surface is built, and each shape is written once.
+        """
+
+        if isinstance(step, StepGroup):
+            for nested in step.steps:
+                self.apply(nested, target)
+            return
+        if self._is_solid_rect(step):
+            target.fill(hex_to_rgb(step.fill), self._clip_to_canvas(step))
+            return
+        xs = ys = _NO_POINTS
+        if isinstance(step, PixelsStep):
+            xs, ys = self._clip_points(step)
+        self._draw_leaf(target, step, xs, ys)
+
+    def _draw_leaf(
+        self, surface: pygame.Surface, step: CanvasStep, xs: np.ndarray, ys: np.ndarray
+    ) -> None:
         if isinstance(step, RectStep):
             rect = pygame.Rect(step.x, step.y, step.w, step.h)
             if step.fill:
@@ -105,18 +223,53 @@ class StepPreparer:
             if step.outline:
                 pygame.draw.polygon(surface, hex_to_rgb(step.outline), step.points, width=1)
         elif isinstance(step, PixelsStep):
-            points = list(step.points)
-            for x, y in points:
-                surface.set_at((x, y), hex_to_rgb(step.color))
+            _plot_pixels(surface, xs, ys, hex_to_rgb(step.color))
         elif isinstance(step, TextStep):
-            font = pygame.font.SysFont(step.font or "monospace", step.size)
+            font = _get_font(step.font or "monospace", step.size)
             text_surface = font.render(step.value, True, hex_to_rgb(step.color))
             surface.blit(text_surface, (step.x, step.y))
         else:  # pragma: no cover - future proofing
             raise ValueError(f"Unsupported step type: {type(step)}")
 
-        timeline = self._build_timeline(step)
-        return PreparedStep(step=step, surface=surface, timeline=timeline, points=points)
+    @staticmethod
+    def _is_solid_rect(step: CanvasStep) -> bool:
+        return (
+            isinstance(step, RectStep)
+            and bool(step.fill)
+            and not step.outline
+            and step.w > 0
+            and step.h > 0
+        )
+
+    def _clip_to_canvas(self, step: RectStep) -> pygame.Rect:
+        canvas = pygame.Rect(0, 0, self._canvas.w, self._canvas.h)
+        return pygame.Rect(step.x, step.y, step.w, step.h).clip(canvas)
+
+    def _clip_points(self, step: PixelsStep) -> tuple[np.ndarray, np.ndarray]:
+        pts = np.asarray(step.points, dtype=np.int32).reshape(-1, 2)
+        xs, ys = pts[:, 0].copy(), pts[:, 1].copy()
+        # set_at silently ignored off-canvas points; array stores must not see them
+        inside = (xs >= 0) & (xs < self._canvas.w) & (ys >= 0) & (ys < self._canvas.h)
+        if inside.all():
+            return xs, ys
+        return xs[inside], ys[inside]
+
+    def _prepare_fill_rect(self, step: RectStep) -> PreparedStep:
+        """Solid rectangles skip the canvas-sized surface and are filled into the target."""
+
+        rect = self._clip_to_canvas(step)
+        color = hex_to_rgb(step.fill)
+        surface = create_canvas(rect.width, rect.height, color)
+        return PreparedStep(
+            step=step,
+            surface=surface,
+            timeline=self._build_timeline(step),
+            xs=_NO_POINTS,
+            ys=_NO_POINTS,
+            fill_rect=rect,
+            color=color,
+            bbox=rect,
+        )
 
     def _build_timeline(self, step: CanvasStep) -> StepTimeline:
         animate: Optional[AnimationConfig] = getattr(step, "animate", None)
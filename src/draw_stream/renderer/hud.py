@@ -12,25 +12,168 @@ on-stream in donor names / messages.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence
 
+import numpy as np
 import pygame
 import re
 
+try:  # pragma: no cover - optional accelerator
+    import ahocorasick
+except ImportError:  # pragma: no cover - fall back to regex scanning
+    ahocorasick = None
+
 from ..models import RenderTask
 from .surface import hex_to_rgb
 
 
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase ``text`` without changing its length, so match spans index the original."""
+
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") lowercase to two code points; leave those as they are.
+    return "".join(lower if len(lower := char.lower()) == 1 else char for char in text)
+
+
+def _censor(word: str) -> str:
+    if len(word) <= 2:
+        return "*" * len(word)
+    return word[0] + "**" + word[-1]
+
+
+def _build_automaton(terms: Sequence[str]):
+    """Compile all terms into one Aho-Corasick automaton, if pyahocorasick is installed."""
+
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, len(term))
+    automaton.make_automaton()
+    return automaton
+
+
+def _display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a cached surface to the display's pixel format once a window exists."""
+
+    return surface.convert_alpha() if pygame.display.get_surface() is not None else surface
+
+
+def _trie_pattern(terms: Sequence[str]) -> str:
+    """Prefix-factored alternation for ``terms``.
+
+    Terms sharing a prefix share one branch, so the engine walks each candidate
+    position once instead of retrying every term from scratch.
+    """
+
+    trie: dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return emit(trie)
+
+
+_BANNED_TERMS: tuple[str, ...] = (
+    "nigger",
+    "nigga",
+    "niglet",
+    "porchmonkey",
+    "porch monkey",
+    "coon",
+    "kike",
+    "spic",
+    "wetback",
+    "chink",
+    "gook",
+    "paki",
+    "faggot",
+    "fag",
+    "dyke",
+    "tranny",
+    "trannie",
+    "trannies",
+    "retard",
+    "retarded",
+    "cripple",
+    "crippled",
+    "simp",
+    "incel",
+    "virgin",
+    "kys",
+    "kill yourself",
+    "killyourself",
+    "kill urself",
+    "негр",
+    "нигер",
+    "ниггер",
+    "чурка",
+    "чурки",
+    "хач",
+    "хачи",
+    "хача",
+    "пидор",
+    "пидр",
+    "пидорас",
+    "пидорасы",
+    "пидарас",
+    "пидорасина",
+    "пидрила",
+    "гомик",
+    "жид",
+    "жиды",
+    "жидовка",
+    "жидов",
+    "жидовина",
+    "москаль",
+    "москали",
+    "даун",
+    "калека",
+    "pidor",
+    "pidaras",
+    "pidoras",
+    "pidorass",
+    "negr",
+)
+assert all(isinstance(term, str) and term for term in _BANNED_TERMS)
+
+# Matching structures are built once per process, lowercased and deduplicated,
+# longest first so a plain alternation would still prefer the longer match.
+_BANNED_WORDS: tuple[str, ...] = tuple(
+    sorted({term.lower() for term in _BANNED_TERMS}, key=lambda term: (-len(term), term))
+)
+_BANNED_INITIALS = frozenset(term[0] for term in _BANNED_WORDS)
+_CENSOR_MAP = {term: _censor(term) for term in _BANNED_WORDS}
+_BANNED_PATTERN = re.compile(rf"\b(?:{_trie_pattern(_BANNED_WORDS)})\b", re.UNICODE)
+_BANNED_AUTOMATON = _build_automaton(_BANNED_WORDS)
+
+
 @dataclass(slots=True)
 class HUDState:
     active_task: RenderTask | None
     progress: float
     hold_remaining: float
-    hold_total: float
     queue_preview: Sequence[RenderTask]
     queue_length: int
     caption: str
-    fps: float
 
 
 class HudRenderer:
@@ -41,7 +184,6 @@ class HudRenderer:
         self._title_font = pygame.font.SysFont("arial", base_size + 10, bold=True)
         self._body_font = pygame.font.SysFont("arial", base_size)
         self._small_font = pygame.font.SysFont("arial", base_size - 6)
-        self._mono_font = pygame.font.SysFont("consolas", base_size - 10)
         self._badge_font = pygame.font.SysFont("arial", base_size - 8, bold=True)
         self._fg = hex_to_rgb("#F1F5FF")
         self._secondary = hex_to_rgb("#92A4FF")
@@ -49,97 +191,197 @@ class HudRenderer:
         self._accent_alt = hex_to_rgb("#58E9FF")
         self._warning = hex_to_rgb("#FF6F91")
         self._panel_bg_top = hex_to_rgb("#14192F")
-        self._panel_bg_bottom = hex_to_rgb("#0F1325")
         self._padding = 56
         self._content_gap = content_gap
-        self._banned_terms = [
-            "nigger",
-            "nigga",
-            "niglet",
-            "porchmonkey",
-            "porch monkey",
-            "coon",
-            "kike",
-            "spic",
-            "wetback",
-            "chink",
-            "gook",
-            "paki",
-            "faggot",
-            "fag",
-            "dyke",
-            "tranny",
-            "trannie",
-            "trannies",
-            "retard",
-            "retarded",
-            "cripple",
-            "crippled",
-            "simp",
-            "incel",
-            "virgin",
-            "kys",
-            "kill yourself",
-            "killyourself",
-            "kill urself",
-            "негр",
-            "нигер",
-            "ниггер",
-            "чурка",
-            "чурки",
-            "хач",
-            "хачи",
-            "хача",
-            "пидор",
-            "пидр",
-            "пидорас",
-            "пидорасы",
-            "пидарас",
-            "пидорасина",
-            "пидрила",
-            "гомик",
-            "жид",
-            "жиды",
-            "жидовка",
-            "жидов",
-            "жидовина",
-            "москаль",
-            "москали",
-            "даун",
-            "калека"
-            "pidor",
-            "pidaras",
-            "pidoras",
-            "pidorass",
-            "negr",
-        ]
-
-        self._banned_patterns = [
-            re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE)
-            for term in self._banned_terms
-        ]
+        # Donor names, captions and queue headers repeat every frame; the term set is fixed.
+        self._sanitize_text = lru_cache(maxsize=512)(self._sanitize_text_impl)
+        self._text_cache: dict[tuple[int, str, tuple[int, ...]], pygame.Surface] = {}
+        self._text_cache_limit = 256
+        self._size_cache: dict[int, dict[str, tuple[int, int]]] = {}
+        self._size_cache_limit = 4096
+        self._block_cache: dict[tuple, tuple[pygame.Surface, int]] = {}
+        # style -> (fill RGBA, border RGBA or None, border radius)
+        self._panel_styles: dict[str, tuple[tuple[int, ...], tuple[int, ...] | None, int]] = {
+            "shadow": ((8, 10, 20, 160), None, 46),
+            "glass": ((*self._panel_bg_top, 220), (*self._accent, 110), 36),
+            "header": ((18, 24, 42, 210), (*self._accent, 120), 34),
+            "message": ((18, 22, 38, 210), (*self._accent_alt, 110), 32),
+            "card": ((18, 22, 38, 210), (*self._accent, 120), 30),
+            "footer": ((12, 16, 28, 235), (*self._accent, 120), 28),
+            "badge": ((23, 29, 50, 230), (*self._accent_alt, 140), 22),
+            "chip": ((18, 22, 38, 220), (*self._accent_alt, 140), 20),
+        }
+        self._panel_cache: dict[tuple[int, int, str], pygame.Surface] = {}
+        self._gradient_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self._gloss_cache: dict[tuple[int, int], pygame.Surface] = {}
+        self._track_cache: dict[tuple[int, int], pygame.Surface] = {}
+        # Panel rects only depend on the window size and canvas placement.
+        self._layout_key: tuple | None = None
+        self._layout: tuple[pygame.Rect, pygame.Rect, pygame.Rect] | None = None
+        # Everything except the progress bar and hold countdown only changes with the
+        # task, queue or caption; meanwhile the display keeps those pixels and the drawn
+        # panels are snapshotted so the live widgets can be erased from them.
+        self._static_key: tuple | None = None
+        self._task_keys: tuple | None = None
+        self._static_snapshots: list[tuple[pygame.Surface, pygame.Rect]] = []
+        self._progress_rect = pygame.Rect(0, 0, 0, 0)
+        self._hold_origin = (0, 0)
+        self._live_rect = pygame.Rect(0, 0, 0, 0)
+        self._dirty_rect = pygame.Rect(0, 0, 0, 0)
+        self._live_key: tuple | None = None
+        # Fixed labels are rendered once here instead of on every draw.
+        self._title_draw_stream = _display_format(
+            self._hero_font.render("Draw Stream", True, self._fg)
+        )
+        self._title_now_painting = _display_format(
+            self._title_font.render("Now Painting", True, self._fg)
+        )
+        self._title_queue = _display_format(self._title_font.render("Queue", True, self._fg))
+        self._label_live_painting = _display_format(
+            self._badge_font.render("LIVE PAINTING", True, self._fg)
+        )
+        self._label_queue_empty = _display_format(
+            self._small_font.render("No pending requests", True, self._secondary)
+        )
 
-    def _censor_match(self, match: re.Match) -> str:
-        word = match.group(0)
-        if len(word) <= 2:
-            return "*" * len(word)
-        return word[0] + "**" + word[-1]
+    def _sanitize_text_impl(self, text: str) -> str:
+        """Mask any banned terms in the given text (memoized as ``_sanitize_text``).
 
-    def _sanitize_text(self, text: str) -> str:
-        """Mask any banned terms in the given text."""
+        Terms are matched on a lowercased copy; the masks are spliced into the
+        original so the displayed case is kept.
+        """
         if not text:
             return text
-        result = text
-        for pattern in self._banned_patterns:
-            result = pattern.sub(self._censor_match, result)
-        return result
+        lowered = _fold_case(text)
+        # Most labels ("Queue", "5.00 USD") share no letter with any term's first character.
+        # Finer screens (e.g. leading trigrams) need a Python-level loop over the text and
+        # cost more than the matchers below, so this set test is the only pre-filter.
+        if _BANNED_INITIALS.isdisjoint(lowered):
+            return text
+        if _BANNED_AUTOMATON is not None:
+            spans = self._automaton_spans(lowered)
+        else:
+            spans = [match.span() for match in _BANNED_PATTERN.finditer(lowered)]
+        if not spans:
+            return text
+
+        pieces: list[str] = []
+        cursor = 0
+        for start, end in spans:
+            word = text[start:end]
+            term = lowered[start:end]
+            pieces.append(text[cursor:start])
+            # Mixed-case hits keep their own first/last letters.
+            pieces.append(_CENSOR_MAP[term] if word == term else _censor(word))
+            cursor = end
+        pieces.append(text[cursor:])
+        return "".join(pieces)
+
+    def _automaton_spans(self, lowered: str) -> list[tuple[int, int]]:
+        """Leftmost-longest, non-overlapping term spans with regex-style word boundaries."""
+
+        spans: list[tuple[int, int]] = []
+        limit = len(lowered)
+        for last, length in _BANNED_AUTOMATON.iter(lowered):
+            start, end = last - length + 1, last + 1
+            if start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            if end < limit and _is_word_char(lowered[end]):
+                continue
+            spans.append((start, end))
+
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        selected: list[tuple[int, int]] = []
+        cursor = 0
+        for start, end in spans:
+            if start >= cursor:
+                selected.append((start, end))
+                cursor = end
+        return selected
 
     def draw(self, surface: pygame.Surface, state: HUDState, canvas_rect: pygame.Rect) -> None:
-        width, height = surface.get_size()
+        size = surface.get_size()
+        width, height = size
         header_height = 64
-        header_rect = self._draw_header(surface, state, width, header_height)
-        self._draw_status_chip(surface, state, canvas_rect, header_rect)
 
+        layout_key = (size, tuple(canvas_rect))
+        if layout_key != self._layout_key:
+            self._layout = self._compute_layout(size, canvas_rect, header_height)
+            self._layout_key = layout_key
+        info_rect, queue_rect, footer_rect = self._layout
+
+        static_key = (*layout_key, self._static_state_key(state))
+        if static_key == self._static_key:
+            if self.live_unchanged(state):
+                # The screen already shows exactly this HUD.
+                self._dirty_rect = pygame.Rect(0, 0, 0, 0)
+                return
+            self._restore_static(surface, self._live_rect)
+        else:
+            header_rect = self._draw_header(surface, state, width, header_height)
+            chip_rect = self._draw_status_chip(surface, state, canvas_rect, header_rect)
+            self._draw_glass_panel(surface, info_rect)
+            self._draw_glass_panel(surface, queue_rect)
+            self._draw_active(surface, state, info_rect.inflate(-48, -48))
+            self._draw_queue(
+                surface, state.queue_preview, state.queue_length, queue_rect.inflate(-48, -48)
+            )
+            self._draw_footer(surface, state, footer_rect)
+            badge_rect = self._draw_canvas_badge(surface, state, canvas_rect)
+            drawn = [
+                header_rect,
+                chip_rect,
+                info_rect.inflate(40, 40),
+                queue_rect.inflate(40, 40),
+                footer_rect,
+                badge_rect,
+            ]
+            self._store_static_snapshots(surface, static_key, drawn, canvas_rect)
+
+        self._draw_progress_bar(surface, self._progress_rect, state.progress)
+        live_rect = self._progress_rect.copy()
+        self._live_key = live_key = self._compute_live_key(state)
+        hold_text = live_key[1]
+        if hold_text is not None:
+            hold_label = self._render_cached(
+                self._small_font, self._sanitize_text(hold_text), self._warning
+            )
+            live_rect.union_ip(surface.blit(hold_label, self._hold_origin))
+        # The previous label may have been wider, so its area is dirty as well.
+        self._dirty_rect = live_rect.union(self._live_rect)
+        self._live_rect = live_rect
+
+    def live_unchanged(self, state: HUDState) -> bool:
+        """Whether ``state`` would redraw the progress bar and hold label exactly as last time."""
+
+        return self._live_key == self._compute_live_key(state)
+
+    def _compute_live_key(self, state: HUDState) -> tuple[int, str | None]:
+        # Mirrors what the live widgets actually show: the filled pixel width and the label text.
+        inner_width = self._progress_rect.width - 8
+        fill_width = int(inner_width * max(0.0, min(1.0, state.progress)))
+        hold_text = None
+        if state.hold_remaining > 0:
+            hold_text = f"Result on screen for {state.hold_remaining:0.0f}s"
+        return fill_width, hold_text
+
+    @property
+    def dirty_rect(self) -> pygame.Rect:
+        """Area the last ``draw`` changed when the static layer was already on screen."""
+
+        return self._dirty_rect
+
+    def _restore_static(self, surface: pygame.Surface, area: pygame.Rect) -> None:
+        # Only the last live widgets are erased; the rest of the static layer is still on screen.
+        for snapshot, rect in self._static_snapshots:
+            overlap = rect.clip(area)
+            if overlap.width and overlap.height:
+                surface.blit(snapshot, overlap.topleft, overlap.move(-rect.x, -rect.y))
+
+    def _compute_layout(
+        self, size: tuple[int, int], canvas_rect: pygame.Rect, header_height: int
+    ) -> tuple[pygame.Rect, pygame.Rect, pygame.Rect]:
+        width, height = size
         panel_x = canvas_rect.right + self._content_gap
         panel_width = max(560, width - panel_x - self._padding)
         if panel_x + panel_width + self._padding > width:
@@ -151,38 +393,125 @@ class HudRenderer:
         queue_top = info_rect.bottom + 20
         queue_rect = pygame.Rect(panel_x, queue_top, panel_width, available_height - info_rect.height - 20)
         footer_rect = pygame.Rect(self._padding, height - 84, width - 2 * self._padding, 72)
+        return info_rect, queue_rect, footer_rect
+
+    def covers_background(
+        self, size: tuple[int, int], state: HUDState, canvas_rect: pygame.Rect
+    ) -> bool:
+        """Whether the static HUD the next ``draw`` needs is the one already on screen.
+
+        When true the caller can skip repainting the backdrop behind the HUD: ``draw``
+        then only touches the progress bar and hold countdown.
+        """
+
+        return self._static_key == (size, tuple(canvas_rect), self._static_state_key(state))
+
+    @staticmethod
+    def _task_key(task: RenderTask) -> tuple:
+        event = task.event
+        return (event.id, event.donor, event.amount, event.currency, event.message)
+
+    def _static_state_key(self, state: HUDState) -> tuple:
+        # The runtime hands over the same task and preview tuple until they change,
+        # so the per-task keys are only rebuilt when either object is replaced.
+        cached = self._task_keys
+        if (
+            cached is None
+            or cached[0] is not state.active_task
+            or cached[1] is not state.queue_preview
+        ):
+            active = self._task_key(state.active_task) if state.active_task else None
+            queue = tuple(self._task_key(task) for task in state.queue_preview[:5])
+            cached = self._task_keys = (state.active_task, state.queue_preview, active, queue)
+        return (cached[2], cached[3], state.queue_length, state.caption)
+
+    def _store_static_snapshots(
+        self,
+        surface: pygame.Surface,
+        key: tuple,
+        drawn: list[pygame.Rect],
+        canvas_rect: pygame.Rect,
+    ) -> None:
+        """Copy the drawn panels so unchanged frames only repaint the live widgets.
 
-        self._draw_glass_panel(surface, info_rect)
-        self._draw_glass_panel(surface, queue_rect)
-        self._draw_active(surface, state, info_rect.inflate(-48, -48))
-        self._draw_queue(surface, state.queue_preview, state.queue_length, queue_rect.inflate(-48, -48))
-        self._draw_footer(surface, state, footer_rect)
-        self._draw_canvas_badge(surface, state, canvas_rect)
+        The progress bar and hold countdown sit inside these panels, so erasing them
+        needs nothing beyond the panel pixels.
+        """
+
+        if any(rect.colliderect(canvas_rect) for rect in drawn):
+            # The canvas changes underneath every frame; keep drawing live.
+            self._static_key = None
+            self._static_snapshots = []
+            return
+        bounds = surface.get_rect()
+        clipped = [rect.clip(bounds) for rect in drawn]
+        self._static_key = key
+        self._static_snapshots = [
+            (surface.subsurface(rect).copy(), rect)
+            for rect in clipped
+            if rect.width > 0 and rect.height > 0
+        ]
+
+    def _render_cached(
+        self, font: pygame.font.Font, text: str, color: tuple[int, ...]
+    ) -> pygame.Surface:
+        """Antialiased render of ``text``, shared between calls; callers must not mutate it."""
+
+        key = (id(font), text, tuple(color))
+        # Re-inserting on every hit keeps the dict in least-recently-used order.
+        rendered = self._text_cache.pop(key, None)
+        if rendered is None:
+            if len(self._text_cache) >= self._text_cache_limit:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            rendered = _display_format(font.render(text, True, color))
+        self._text_cache[key] = rendered
+        return rendered
+
+    def _measure(self, font: pygame.font.Font, text: str) -> tuple[int, int]:
+        """Memoized ``font.size``; wrapping re-measures the same strings every frame."""
+
+        sizes = self._size_cache.setdefault(id(font), {})
+        size = sizes.get(text)
+        if size is None:
+            if len(sizes) >= self._size_cache_limit:
+                sizes.clear()
+            size = font.size(text)
+            sizes[text] = size
+        return size
+
+    def _get_panel(self, size: tuple[int, int], style: str) -> pygame.Surface:
+        """Return the rounded background for ``style`` at ``size``, rasterized once per size."""
+
+        key = (size[0], size[1], style)
+        # Badges and chips vary in width with their text; LRU order keeps the large
+        # glass/shadow panels resident instead of clearing everything when full.
+        panel = self._panel_cache.pop(key, None)
+        if panel is not None:
+            self._panel_cache[key] = panel
+            return panel
+        # pygame fills rounded rects with spans and corner circles (no AA), which measured
+        # faster than composing nine-slice atlases with corner blits and stretched edges.
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        fill, border, radius = self._panel_styles[style]
+        pygame.draw.rect(panel, fill, panel.get_rect(), border_radius=radius)
+        if border is not None:
+            pygame.draw.rect(panel, border, panel.get_rect(), width=2, border_radius=radius)
+        panel = _display_format(panel)
+        if len(self._panel_cache) >= self._text_cache_limit:
+            self._panel_cache.pop(next(iter(self._panel_cache)))
+        self._panel_cache[key] = panel
+        return panel
 
     def _draw_glass_panel(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
-        shadow = pygame.Surface((rect.width + 40, rect.height + 40), pygame.SRCALPHA)
-        pygame.draw.rect(shadow, (8, 10, 20, 160), shadow.get_rect(), border_radius=46)
-        shadow = pygame.transform.smoothscale(shadow, shadow.get_size())
+        shadow = self._get_panel((rect.width + 40, rect.height + 40), "shadow")
         surface.blit(shadow, (rect.x - 20, rect.y - 20))
-
-        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(
-            panel,
-            (self._panel_bg_top[0], self._panel_bg_top[1], self._panel_bg_top[2], 220),
-            panel.get_rect(),
-            border_radius=36,
-        )
-        pygame.draw.rect(panel, (*self._accent, 110), panel.get_rect(), width=2, border_radius=36)
-        surface.blit(panel, rect.topleft)
+        surface.blit(self._get_panel(rect.size, "glass"), rect.topleft)
 
     def _draw_header(self, surface: pygame.Surface, state: HUDState, width: int, height: int) -> pygame.Rect:
         rect = pygame.Rect(self._padding, self._padding, width - 2 * self._padding, height)
-        banner = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(banner, (18, 24, 42, 210), banner.get_rect(), border_radius=34)
-        pygame.draw.rect(banner, (*self._accent, 120), banner.get_rect(), width=2, border_radius=34)
-        surface.blit(banner, rect.topleft)
+        surface.blit(self._get_panel(rect.size, "header"), rect.topleft)
 
-        title = self._hero_font.render("Draw Stream", True, self._fg)
+        title = self._title_draw_stream
         title_rect = title.get_rect(midleft=(rect.x + 32, rect.centery))
         surface.blit(title, title_rect)
         return rect
@@ -193,7 +522,7 @@ class HudRenderer:
         state: HUDState,
         canvas_rect: pygame.Rect,
         header_rect: pygame.Rect,
-    ) -> None:
+    ) -> pygame.Rect:
         if state.active_task:
             donor = state.active_task.event.donor or "anonymous"
             chip_text = f"Thank you, {donor}!"
@@ -207,11 +536,12 @@ class HudRenderer:
         chip_y = header_rect.bottom + 20
         chip_rect = pygame.Rect(chip_x, chip_y, chip_width, chip_height)
         self._render_chip(surface, chip_rect, label, padding_x, padding_y)
+        return chip_rect
 
     def _draw_active(self, surface: pygame.Surface, state: HUDState, rect: pygame.Rect) -> None:
         x = rect.x
         y = rect.y
-        title = self._title_font.render("Now Painting", True, self._fg)
+        title = self._title_now_painting
         surface.blit(title, (x, y))
         y += title.get_height() + 12
 
@@ -238,20 +568,12 @@ class HudRenderer:
         self._draw_message_panel(surface, state, message_rect)
         y = message_rect.bottom + 24
 
-        bar_rect = pygame.Rect(x, y, rect.width, 30)
-        self._draw_progress_bar(surface, bar_rect, state.progress)
-        y += bar_rect.height + 10
-
-        if state.hold_remaining > 0:
-            hold_text = f"Result on screen for {state.hold_remaining:0.0f}s"
-            hold_label = self._small_font.render(self._sanitize_text(hold_text), True, self._warning)
-            surface.blit(hold_label, (x, y))
+        # The bar and hold countdown change every frame; draw() paints them after the static layer.
+        self._progress_rect = pygame.Rect(x, y, rect.width, 30)
+        self._hold_origin = (x, y + self._progress_rect.height + 10)
 
     def _draw_message_panel(self, surface: pygame.Surface, state: HUDState, rect: pygame.Rect) -> None:
-        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(panel, (18, 22, 38, 210), panel.get_rect(), border_radius=32)
-        pygame.draw.rect(panel, (*self._accent_alt, 110), panel.get_rect(), width=2, border_radius=32)
-        surface.blit(panel, rect.topleft)
+        surface.blit(self._get_panel(rect.size, "message"), rect.topleft)
 
         if state.active_task:
             message = state.active_task.event.message or ""
@@ -273,33 +595,58 @@ class HudRenderer:
         )
 
     def _draw_progress_bar(self, surface: pygame.Surface, rect: pygame.Rect, progress: float) -> None:
-        pygame.draw.rect(surface, (18, 22, 38, 220), rect, border_radius=18)
-        pygame.draw.rect(surface, (*self._accent, 200), rect, width=2, border_radius=18)
+        track = self._track_cache.get(rect.size)
+        if track is None:
+            # Drawn straight onto the opaque display these colours lost their alpha, so the
+            # cached track is fully opaque inside its rounded corners and blits identically.
+            track = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(track, (18, 22, 38), track.get_rect(), border_radius=18)
+            pygame.draw.rect(track, self._accent, track.get_rect(), width=2, border_radius=18)
+            track = self._track_cache[rect.size] = _display_format(track)
+        surface.blit(track, rect.topleft)
         inner = rect.inflate(-8, -8)
         fill_width = int(inner.width * max(0.0, min(1.0, progress)))
         if fill_width > 0:
             fill_rect = pygame.Rect(inner.x, inner.y, fill_width, inner.height)
-            gradient = pygame.Surface(fill_rect.size, pygame.SRCALPHA)
-            for x in range(fill_rect.width):
-                t = x / max(1, fill_rect.width - 1)
-                color = (
-                    int(self._accent[0] * (0.8 + 0.2 * t)),
-                    int(self._accent_alt[1] * (0.7 + 0.3 * (1 - t))),
-                    int(self._accent_alt[2] * (0.7 + 0.3 * t)),
-                    230,
-                )
-                pygame.draw.line(gradient, color, (x, 0), (x, fill_rect.height))
-            surface.blit(gradient, fill_rect.topleft)
-
-        gloss = pygame.Surface(inner.size, pygame.SRCALPHA)
-        pygame.draw.rect(
-            gloss,
-            (255, 255, 255, 40),
-            gloss.get_rect().inflate(-inner.width * 0.1, -inner.height * 0.4),
-            border_radius=12,
-        )
+            surface.blit(self._get_gradient(fill_rect.size), fill_rect.topleft)
+
+        gloss = self._gloss_cache.get(inner.size)
+        if gloss is None:
+            gloss = pygame.Surface(inner.size, pygame.SRCALPHA)
+            pygame.draw.rect(
+                gloss,
+                (255, 255, 255, 40),
+                gloss.get_rect().inflate(-inner.width * 0.1, -inner.height * 0.4),
+                border_radius=12,
+            )
+            gloss = self._gloss_cache[inner.size] = _display_format(gloss)
         surface.blit(gloss, inner.topleft, special_flags=pygame.BLEND_RGBA_ADD)
 
+    def _get_gradient(self, size: tuple[int, int]) -> pygame.Surface:
+        """Horizontal accent gradient for the progress fill, built column-wise with NumPy."""
+
+        gradient = self._gradient_cache.get(size)
+        if gradient is not None:
+            return gradient
+        width, height = size
+        t = np.arange(width, dtype=np.float64) / max(1, width - 1)
+        columns = np.stack(
+            (
+                self._accent[0] * (0.8 + 0.2 * t),
+                self._accent_alt[1] * (0.7 + 0.3 * (1 - t)),
+                self._accent_alt[2] * (0.7 + 0.3 * t),
+            ),
+            axis=-1,
+        ).astype(np.uint8)
+        gradient = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(gradient)[...] = columns[:, None, :]
+        pygame.surfarray.pixels_alpha(gradient)[...] = 230
+        gradient = _display_format(gradient)
+        if len(self._gradient_cache) >= self._text_cache_limit:
+            self._gradient_cache.clear()
+        self._gradient_cache[size] = gradient
+        return gradient
+
     def _draw_queue(
         self,
         surface: pygame.Surface,
@@ -307,7 +654,7 @@ class HudRenderer:
         queue_length: int,
         rect: pygame.Rect,
     ) -> None:
-        title = self._title_font.render("Queue", True, self._fg)
+        title = self._title_queue
         surface.blit(title, (rect.x, rect.y))
         chip_rect = self._draw_chip(
             surface,
@@ -318,8 +665,7 @@ class HudRenderer:
 
         y = rect.y + max(title.get_height(), chip_rect.height) + 20
         if not queue_preview:
-            placeholder = self._small_font.render("No pending requests", True, self._secondary)
-            surface.blit(placeholder, (rect.x, y))
+            surface.blit(self._label_queue_empty, (rect.x, y))
             return
 
         card_height = 96
@@ -329,15 +675,12 @@ class HudRenderer:
             y += card_height + 14
 
     def _draw_queue_entry(self, surface: pygame.Surface, rect: pygame.Rect, index: int, task: RenderTask) -> None:
-        card = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(card, (18, 22, 38, 210), card.get_rect(), border_radius=30)
-        pygame.draw.rect(card, (*self._accent, 120), card.get_rect(), width=2, border_radius=30)
-        surface.blit(card, rect.topleft)
+        surface.blit(self._get_panel(rect.size, "card"), rect.topleft)
 
         circle_radius = 22
         circle_center = (rect.x + 32 + circle_radius, rect.y + rect.height // 2)
         pygame.draw.circle(surface, (*self._accent_alt, 220), circle_center, circle_radius)
-        index_label = self._badge_font.render(str(index), True, self._fg)
+        index_label = self._render_cached(self._badge_font, str(index), self._fg)
         idx_rect = index_label.get_rect(center=circle_center)
         surface.blit(index_label, idx_rect)
 
@@ -345,7 +688,8 @@ class HudRenderer:
         header_text = f"{donor} · {task.event.amount} {task.event.currency}"
         header_y = rect.y + 18
         safe_header = self._sanitize_text(header_text)
-        surface.blit(self._body_font.render(safe_header, True, self._fg), (rect.x + 80, header_y))
+        header = self._render_cached(self._body_font, safe_header, self._fg)
+        surface.blit(header, (rect.x + 80, header_y))
 
         if task.event.message:
             message_y = header_y + self._body_font.get_linesize() + 4
@@ -362,33 +706,34 @@ class HudRenderer:
             )
 
     def _draw_footer(self, surface: pygame.Surface, state: HUDState, rect: pygame.Rect) -> None:
-        footer = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(footer, (12, 16, 28, 235), footer.get_rect(), border_radius=28)
-        pygame.draw.rect(footer, (*self._accent, 120), footer.get_rect(), width=2, border_radius=28)
-        surface.blit(footer, rect.topleft)
+        surface.blit(self._get_panel(rect.size, "footer"), rect.topleft)
 
         caption = state.caption or "All for you"
         safe_caption = self._sanitize_text(caption)
-        caption_label = self._title_font.render(safe_caption, True, self._fg)
+        caption_label = self._render_cached(self._title_font, safe_caption, self._fg)
         caption_rect = caption_label.get_rect(center=(rect.centerx, rect.centery))
         surface.blit(caption_label, caption_rect)
 
         # Counters removed per design request.
 
-    def _draw_canvas_badge(self, surface: pygame.Surface, state: HUDState, canvas_rect: pygame.Rect) -> None:
-        text = "LIVE PAINTING"
+    def _draw_canvas_badge(
+        self, surface: pygame.Surface, state: HUDState, canvas_rect: pygame.Rect
+    ) -> pygame.Rect:
         if state.active_task and state.active_task.event.donor:
             text = f"LIVE · {state.active_task.event.donor}"
-        safe_text = self._sanitize_text(text).upper()
-        label = self._badge_font.render(safe_text, True, self._fg)
+            safe_text = self._sanitize_text(text).upper()
+            label = self._render_cached(self._badge_font, safe_text, self._fg)
+        else:
+            label = self._label_live_painting
         badge_width = max(260, label.get_width() + 80)
         badge_rect = pygame.Rect(canvas_rect.x + 32, canvas_rect.top - 60, badge_width, 44)
-        badge = pygame.Surface(badge_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(badge, (23, 29, 50, 230), badge.get_rect(), border_radius=22)
-        pygame.draw.rect(badge, (*self._accent_alt, 140), badge.get_rect(), width=2, border_radius=22)
-        surface.blit(badge, badge_rect.topleft)
+        # Background and label are both cached and only blitted when the static layer is
+        # redrawn. They are not pre-composited into one surface, because the badge fill is
+        # translucent and blending the label into it first would shift the edge pixels.
+        surface.blit(self._get_panel(badge_rect.size, "badge"), badge_rect.topleft)
         label_rect = label.get_rect(center=badge_rect.center)
         surface.blit(label, label_rect)
+        return badge_rect
 
     def _draw_chip(
         self,
@@ -416,7 +761,7 @@ class HudRenderer:
             safe_text,
             (max_width - padding_x * 2) if max_width else None,
         )
-        label = self._small_font.render(label_text, True, self._fg)
+        label = self._render_cached(self._small_font, label_text, self._fg)
         width = label.get_width() + padding_x * 2
         if max_width is not None:
             width = min(width, max_width)
@@ -431,20 +776,23 @@ class HudRenderer:
         padding_x: int,
         padding_y: int,
     ) -> None:
-        chip = pygame.Surface(rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(chip, (18, 22, 38, 220), chip.get_rect(), border_radius=20)
-        pygame.draw.rect(chip, (*self._accent_alt, 140), chip.get_rect(), width=2, border_radius=20)
-        surface.blit(chip, rect.topleft)
+        surface.blit(self._get_panel(rect.size, "chip"), rect.topleft)
         surface.blit(label, (rect.x + padding_x, rect.y + padding_y))
 
     def _truncate_text(self, font: pygame.font.Font, text: str, max_width: int | None) -> str:
-        if max_width is None or font.size(text)[0] <= max_width:
+        if max_width is None or self._measure(font, text)[0] <= max_width:
             return text
         ellipsis = "…"
-        max_width = max(max_width, font.size(ellipsis)[0])
-        trimmed = text
-        while trimmed and font.size(trimmed + ellipsis)[0] > max_width:
-            trimmed = trimmed[:-1]
+        max_width = max(max_width, self._measure(font, ellipsis)[0])
+        # Longest prefix that still fits next to the ellipsis; width grows with length.
+        low, high = 0, len(text) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._measure(font, text[:mid] + ellipsis)[0] <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        trimmed = text[:low]
         return (trimmed + ellipsis) if trimmed else ellipsis
 
     def _render_wrapped(
@@ -464,36 +812,98 @@ class HudRenderer:
 
         safe_text = self._sanitize_text(text)
 
-        lines = self._wrap_text(font, safe_text, max_width)
+        key = (id(font), safe_text, tuple(color), max_width, max_lines, line_spacing)
+        cached = self._block_cache.pop(key, None)
+        if cached is None:
+            if len(self._block_cache) >= self._text_cache_limit:
+                self._block_cache.pop(next(iter(self._block_cache)))
+            cached = self._compose_block(font, safe_text, color, max_width, max_lines, line_spacing)
+        self._block_cache[key] = cached
+        block, advance = cached
+        surface.blit(block, (x, y))
+        return y + advance
+
+    def _compose_block(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+        max_width: int,
+        max_lines: int | None,
+        line_spacing: int,
+    ) -> tuple[pygame.Surface, int]:
+        """Wrap ``text`` and stack its lines on one transparent surface for a single blit."""
+
+        lines = self._wrap_text(font, text, max_width)
         if max_lines is not None:
             lines = lines[:max_lines]
-
-        for line in lines:
-            rendered = font.render(line, True, color)
-            surface.blit(rendered, (x, y))
-            y += rendered.get_height() + line_spacing
-
-        return y
+        rendered = [font.render(line, True, color) for line in lines]
+        # Rendered heights track the glyphs (accents, descenders) and can exceed the font's
+        # linesize, so lines advance by their own height; this only runs on a cache miss.
+        advance = sum(line.get_height() + line_spacing for line in rendered)
+        block = pygame.Surface(
+            (max(1, max(line.get_width() for line in rendered)), max(1, advance)), pygame.SRCALPHA
+        )
+        placements = []
+        offset = 0
+        for line in rendered:
+            placements.append((line, (0, offset)))
+            offset += line.get_height() + line_spacing
+        block.blits(placements, doreturn=False)
+        return _display_format(block), advance
 
     def _wrap_text(self, font: pygame.font.Font, text: str, max_width: int) -> list[str]:
         if not text:
             return [""]
 
         words = text.split()
+        joined = " ".join(words)
+        # Word j spans joined[starts[j]:ends[j]], so any run of words is a single slice.
+        starts: list[int] = []
+        ends: list[int] = []
+        offset = 0
+        for word in words:
+            starts.append(offset)
+            offset += len(word)
+            ends.append(offset)
+            offset += 1
+
+        def fits(current: str, first: int, count: int) -> bool:
+            run = joined[starts[first] : ends[first + count - 1]]
+            candidate = f"{current} {run}" if current else run
+            return self._measure(font, candidate)[0] <= max_width
+
         lines: list[str] = []
         current = ""
-
-        for word in words:
-            tentative = f"{current} {word}".strip()
-            if tentative and font.size(tentative)[0] <= max_width:
-                current = tentative
-                continue
+        index = 0
+        total = len(words)
+        while index < total:
+            # Greedy fill, found by binary search over how many words still fit on the line.
+            remaining = total - index
+            if fits(current, index, remaining):
+                low = remaining
+            else:
+                low, high = 0, remaining - 1
+                while low < high:
+                    mid = (low + high + 1) // 2
+                    if fits(current, index, mid):
+                        low = mid
+                    else:
+                        high = mid - 1
+            if low:
+                run = joined[starts[index] : ends[index + low - 1]]
+                current = f"{current} {run}" if current else run
+                index += low
+                if index == total:
+                    break
 
             if current:
                 lines.append(current)
                 current = ""
 
-            if font.size(word)[0] <= max_width:
+            word = words[index]
+            index += 1
+            if self._measure(font, word)[0] <= max_width:
                 current = word
                 continue
 
@@ -512,7 +922,7 @@ class HudRenderer:
         buffer = ""
         for char in word:
             candidate = buffer + char
-            if font.size(candidate)[0] <= max_width or not buffer:
+            if self._measure(font, candidate)[0] <= max_width or not buffer:
                 buffer = candidate
             else:
                 segments.append(buffer)
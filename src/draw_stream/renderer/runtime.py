@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pygame
 
 from ..canvas_dsl import CanvasDocument
@@ -14,17 +14,17 @@ from ..config import Settings, get_settings
 from ..models import RenderTask, RenderTaskType
 from ..queue import QueueManager
 from ..logging import configure_logging
-from .animations import PreparedStep, StepPreparer
+from .animations import PreparedPlan, PreparedStep, StepPreparer
 from .hud import HUDState, HudRenderer
 from .surface import create_canvas, hex_to_rgb, init_pygame, upscale
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RendererState:
     active_task: Optional[RenderTask]
     progress: float
     hold_remaining: float
-    queue_preview: list[RenderTask]
+    queue_preview: tuple[RenderTask, ...]
     fps: float
 
 
@@ -40,34 +40,63 @@ class RendererRuntime:
 
         # drawing state
         self._active_task: Optional[RenderTask] = None
+        self._prepared_plan: Optional[PreparedPlan] = None
         self._prepared_steps: list[PreparedStep] = []
+        # Progress at the start of each step, filled in once per plan.
+        self._step_progress: list[float] = []
+        self._step_delays: list[int] = []
+        self._step_durations: list[int] = []
         self._step_index = 0
         self._step_elapsed = 0.0
         self._step_delay = 0.0
         self._drawing_complete = False
         self._caption = "All for you"
-        self._holding_until: Optional[float] = None
-        self._task_done_pending = False
-
-        self._base_surface = create_canvas(self._settings.canvas_w, self._settings.canvas_h)
-        self._frame_surface = self._base_surface.copy()
+        # Holds are timed against the summed frame-clock ticks rather than wall-clock reads.
+        self._frame_clock_ms = 0.0
+        self._holding_until_ms: Optional[float] = None
+
+        self._default_bg_color = hex_to_rgb("#202020")
+        self._text_card_color = hex_to_rgb("#FFFFFF")
+        self._bg_color = self._default_bg_color
+        self._base_surface = create_canvas(
+            self._settings.canvas_w, self._settings.canvas_h, self._bg_color
+        )
+        self._frame_surface = self._base_surface
+        # Reused scratch canvas for in-progress step overlays. It matches the base canvas
+        # except inside ``_overlay_dirty``; ``None`` means it must be resynced in full.
+        self._overlay_buffer: Optional[pygame.Surface] = None
+        self._overlay_dirty: Optional[pygame.Rect] = None
+        # Bumped whenever the canvas pixels change, so an unchanged canvas is not re-upscaled.
+        self._canvas_version = 0
+        self._scaled_cache: Optional[tuple[pygame.Surface, int, pygame.Surface]] = None
+        self._presented_canvas: Optional[tuple[pygame.Surface, int]] = None
         self._display_surface: Optional[pygame.Surface] = None
         self._backdrop_surface: Optional[pygame.Surface] = None
         self._hud: Optional[HudRenderer] = None
         self._clock = pygame.time.Clock()
         self._step_preparer: Optional[StepPreparer] = None
-        self._bg_color = hex_to_rgb("#202020")
         self._accent_color = hex_to_rgb("#6C63FF")
         self._shadow_color = hex_to_rgb("#090C12")
         self._skip_requested = False
-        self._queue_preview: list[RenderTask] = []
+        # Replaced, never mutated, so it can be shared with snapshots and the HUD.
+        self._queue_preview: tuple[RenderTask, ...] = ()
         self._queue_length = 0
+        self._preview_version: Optional[int] = None
+        # Captured once per rendered frame; the HUD and snapshot() read the same values.
+        self._state = RendererState(
+            active_task=None, progress=0.0, hold_remaining=0.0, queue_preview=(), fps=0.0
+        )
         self._canvas_scale = max(1, self._settings.window_scale)
         self._canvas_rect = pygame.Rect(0, 0, self._settings.canvas_w * self._canvas_scale, self._settings.canvas_h * self._canvas_scale)
         self._side_padding = 96
         self._content_gap = 120
         self._canvas_frame_rect = self._canvas_rect.inflate(40, 40)
         self._fallback_overlay: Optional[pygame.Surface] = None
+        self._canvas_frame_layers: Optional[
+            list[tuple[pygame.Surface, tuple[int, int], None, int]]
+        ] = None
+        self._text_card_cache: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}
+        self._text_card_cache_limit = 16
         self._info_panel_width = 0
 
     async def start(self) -> None:
@@ -79,7 +108,13 @@ class RendererRuntime:
         self._compute_canvas_layout(window_width, window_height)
         init_pygame("Draw Stream", window_width, window_height)
         self._display_surface = pygame.display.get_surface()
-        self._backdrop_surface = self._build_backdrop_surface(window_width, window_height)
+        # The backdrop is pure NumPy/pixel work, so it builds in a worker thread while the
+        # event loop keeps serving; only the conversion to the display format stays here.
+        backdrop = await asyncio.to_thread(
+            self._build_backdrop_surface, window_width, window_height
+        )
+        # Match the display format so the per-frame blit is a plain opaque copy.
+        self._backdrop_surface = backdrop.convert()
         self._hud = HudRenderer((window_width, window_height), content_gap=self._content_gap)
         self._running = True
         self._loop_task = asyncio.create_task(self._run_loop(), name="renderer-loop")
@@ -102,24 +137,30 @@ class RendererRuntime:
         self._skip_requested = True
 
     def snapshot(self) -> "RendererState":
-        hold_remaining = max(0.0, (self._holding_until or 0) - time.monotonic()) if self._holding_until else 0.0
-        return RendererState(
-            active_task=self._active_task,
-            progress=self._compute_progress(),
-            hold_remaining=hold_remaining,
-            queue_preview=list(self._queue_preview),
-            fps=self._clock.get_fps(),
-        )
+        """Return the state shown by the most recently rendered frame."""
+
+        return self._state
 
     async def _run_loop(self) -> None:
+        frame_ms = 1000.0 / self._settings.frame_rate
         while self._running:
+            frame_start = pygame.time.get_ticks()
             self._process_events()
-            dt_ms = self._clock.tick(self._settings.frame_rate)
+            # tick() only measures here; the frame cap is enforced by the sleep below, so the
+            # spare frame time is spent in the event loop (API, ingest) instead of blocking it.
+            dt_ms = self._clock.tick()
+            # The one clock read the frame's timing uses: step progress, the hold countdown and
+            # the snapshot captured by _render_frame all derive from dt_ms / _frame_clock_ms.
+            self._frame_clock_ms += dt_ms
             await self._assign_tasks()
             self._advance_animation(dt_ms)
-            await self._refresh_preview()
+            # The queue bumps its version on every mutation, so an unchanged queue costs one
+            # comparison per frame rather than a coroutine and two locked reads.
+            if self._queue.version != self._preview_version:
+                await self._refresh_preview()
             self._render_frame()
-            await asyncio.sleep(0)
+            remaining_ms = frame_ms - (pygame.time.get_ticks() - frame_start)
+            await asyncio.sleep(max(0.0, remaining_ms) / 1000.0)
 
     def _process_events(self) -> None:
         for event in pygame.event.get():
@@ -142,18 +183,17 @@ class RendererRuntime:
 
     def _apply_new_task(self, task: RenderTask) -> None:
         self._active_task = task
-        self._task_done_pending = True
         self._step_index = 0
         self._step_elapsed = 0.0
         self._step_delay = 0.0
-        self._holding_until = None
+        self._holding_until_ms = None
         self._drawing_complete = False
         self._skip_requested = False
         self._fallback_overlay = None
 
         if task.content_type == RenderTaskType.TEXT:
             self._caption = "All for you"
-            self._bg_color = hex_to_rgb("#202020")
+            self._bg_color = self._default_bg_color
             self._base_surface.fill(self._bg_color)
             self._render_text_card(task.fallback_text or "You are too small")
             self._start_hold_timer(task.hold_duration_sec)
@@ -164,16 +204,24 @@ class RendererRuntime:
         self._caption = plan.caption
         self._bg_color = hex_to_rgb(plan.canvas.bg)
         self._base_surface.fill(self._bg_color)
-        self._frame_surface = self._base_surface.copy()
+        self._frame_surface = self._base_surface
+        self._overlay_dirty = None
+        self._canvas_version += 1
 
+        # Prepared plans are not memoized: a full 96x96 pixel plan prepares in a few ms, about
+        # what serializing it for a content key costs, and the pipeline never repeats objects.
         self._step_preparer = StepPreparer(plan.canvas, self._settings.default_step_duration_ms)
-        self._prepared_steps = []
-        if plan.steps:
-            for step in plan.steps:
-                self._prepared_steps.extend(self._step_preparer.prepare(step))
+        self._prepared_plan = self._step_preparer.prepare_plan(plan)
+        self._prepared_steps = self._prepared_plan.steps
+        total = len(self._prepared_steps)
+        self._step_progress = [index / total for index in range(total)]
+        # Plain lists of the plan's timeline arrays: per-frame lookups index these rather
+        # than reaching through each step's timeline (or boxing NumPy scalars).
+        self._step_delays = self._prepared_plan.delays_ms.tolist()
+        self._step_durations = self._prepared_plan.durations_ms.tolist()
 
         if self._prepared_steps:
-            self._step_delay = self._prepared_steps[0].timeline.delay_ms
+            self._step_delay = float(self._step_delays[0])
         else:
             self._drawing_complete = True
             self._start_hold_timer(self._active_task.hold_duration_sec if self._active_task else None)
@@ -181,6 +229,32 @@ class RendererRuntime:
     def _render_text_card(self, text: str) -> None:
         display_width = self._canvas_rect.width or (self._settings.canvas_w * self._canvas_scale)
         display_height = self._canvas_rect.height or (self._settings.canvas_h * self._canvas_scale)
+        key = (
+            text, display_width, display_height, self._bg_color, self._display_surface is not None
+        )
+        # Re-inserting on every hit keeps the dict in least-recently-used order.
+        card = self._text_card_cache.pop(key, None)
+        if card is None:
+            if len(self._text_card_cache) >= self._text_card_cache_limit:
+                self._text_card_cache.pop(next(iter(self._text_card_cache)))
+            card = self._build_text_card(text, display_width, display_height)
+        self._text_card_cache[key] = card
+        overlay, reduced = card
+        self._fallback_overlay = overlay
+        # The base canvas is cleared in place when the task completes, so it gets its own copy.
+        self._base_surface = reduced.copy()
+        self._frame_surface = self._base_surface
+        self._overlay_dirty = None
+        self._canvas_version += 1
+
+    def _build_text_card(
+        self, text: str, display_width: int, display_height: int
+    ) -> tuple[pygame.Surface, pygame.Surface]:
+        """Build the card at canvas-rect size plus its canvas-resolution reduction.
+
+        Results are cached by ``_render_text_card``, so sizing and conversion happen once per card.
+        """
+
         overlay = pygame.Surface((display_width, display_height), pygame.SRCALPHA)
         overlay.fill(self._bg_color)
 
@@ -204,27 +278,39 @@ class RendererRuntime:
         start_y = max(48, (display_height - total_height) // 2)
         y = start_y
         for line in lines:
-            rendered = font.render(line, True, hex_to_rgb("#FFFFFF"))
+            rendered = font.render(line, True, self._text_card_color)
             rect = rendered.get_rect(center=(display_width // 2, y + rendered.get_height() // 2))
             overlay.blit(rendered, rect)
             y += rendered.get_height() + line_spacing
 
-        self._fallback_overlay = overlay.convert() if self._display_surface else overlay
-        reduced = pygame.transform.smoothscale(overlay, (self._settings.canvas_w, self._settings.canvas_h)).convert()
-        self._base_surface = reduced
-        self._frame_surface = reduced.copy()
+        reduced = pygame.transform.smoothscale(overlay, (self._settings.canvas_w, self._settings.canvas_h))
+        # Both are opaque and blitted every frame of the hold, so match the display format
+        # once here; convert() needs a video mode, which headless callers may not have set.
+        if self._display_surface:
+            overlay = overlay.convert()
+            reduced = reduced.convert()
+        return overlay, reduced
 
     def _wrap_text(self, font: pygame.font.Font, text: str, max_width: int) -> list[str]:
         if not text:
             return [""]
 
+        # Words and segments are re-measured as lines grow, so widths are memoized per pass.
+        widths: dict[str, int] = {}
+
+        def width(value: str) -> int:
+            measured = widths.get(value)
+            if measured is None:
+                measured = widths[value] = font.size(value)[0]
+            return measured
+
         words = text.split()
         lines: list[str] = []
         current = ""
 
         for word in words:
             tentative = f"{current} {word}".strip()
-            if tentative and font.size(tentative)[0] <= max_width:
+            if tentative and width(tentative) <= max_width:
                 current = tentative
                 continue
 
@@ -232,12 +318,12 @@ class RendererRuntime:
                 lines.append(current)
                 current = ""
 
-            if font.size(word)[0] <= max_width:
+            if width(word) <= max_width:
                 current = word
                 continue
 
-            for segment in self._break_long_word(font, word, max_width):
-                if font.size(segment)[0] <= max_width:
+            for segment in self._break_long_word(width, word, max_width):
+                if width(segment) <= max_width:
                     lines.append(segment)
                 else:  # pragma: no cover - ultra narrow fonts
                     lines.extend(list(segment))
@@ -247,35 +333,44 @@ class RendererRuntime:
 
         return lines or [""]
 
-    def _break_long_word(self, font: pygame.font.Font, word: str, max_width: int) -> list[str]:
+    def _break_long_word(
+        self, width: Callable[[str], int], word: str, max_width: int
+    ) -> list[str]:
         """Split a single word into multiple segments that fit within ``max_width``."""
 
         segments: list[str] = []
-        buffer = ""
-        for char in word:
-            candidate = buffer + char
-            if font.size(candidate)[0] <= max_width or not buffer:
-                buffer = candidate
-            else:
-                segments.append(buffer)
-                buffer = char
-        if buffer:
-            segments.append(buffer)
+        start = 0
+        end = len(word)
+        while start < end:
+            # Prefix widths only grow with length, so the longest fitting segment is bracketed
+            # by doubling its length and then bisected; each segment takes at least one char.
+            low, step = start + 1, 1
+            high = min(end, low + step)
+            while high > low and width(word[start:high]) <= max_width:
+                low, step = high, step * 2
+                high = min(end, low + step)
+            high -= 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if width(word[start:middle]) <= max_width:
+                    low = middle
+                else:
+                    high = middle - 1
+            segments.append(word[start:low])
+            start = low
         return segments
 
     def _advance_animation(self, dt_ms: float) -> None:
         if not self._active_task:
-            self._base_surface.fill(self._bg_color)
-            self._frame_surface = self._base_surface.copy()
+            # The idle canvas was already cleared by ``_complete_task`` (or at construction).
             return
 
         if self._skip_requested:
             self._complete_task(skipped=True)
             return
 
-        now = time.monotonic()
-        if self._holding_until is not None:
-            if now >= self._holding_until:
+        if self._holding_until_ms is not None:
+            if self._frame_clock_ms >= self._holding_until_ms:
                 self._complete_task()
             return
 
@@ -293,36 +388,81 @@ class RendererRuntime:
 
         if self._step_delay > 0:
             self._step_delay = max(0.0, self._step_delay - dt_ms)
-            self._frame_surface = self._base_surface.copy()
+            self._frame_surface = self._base_surface
             if self._step_delay == 0:
                 self._step_elapsed = 0.0
             return
 
         self._step_elapsed += dt_ms
-        duration = current.timeline.duration_ms or self._settings.default_step_duration_ms
+        duration = self._step_durations[self._step_index] or self._settings.default_step_duration_ms
         progress = min(1.0, self._step_elapsed / duration)
 
-        self._frame_surface = self._base_surface.copy()
+        # Only an in-progress step draws a transient overlay, so only it needs its own copy;
+        # otherwise the frame simply aliases the base canvas.
+        self._frame_surface = self._overlay_frame(current.bbox)
         current.render(self._frame_surface, progress)
+        self._canvas_version += 1
 
         if progress >= 1.0:
             current.apply_final(self._base_surface)
+            self._canvas_version += 1
             self._step_index += 1
             self._step_elapsed = 0.0
             if self._step_index < len(self._prepared_steps):
-                self._step_delay = self._prepared_steps[self._step_index].timeline.delay_ms
+                self._step_delay = self._step_delays[self._step_index]
             else:
-                self._frame_surface = self._base_surface.copy()
+                self._frame_surface = self._base_surface
+
+    def _overlay_frame(self, bbox: Optional[pygame.Rect]) -> pygame.Surface:
+        """Bring the overlay buffer back in line with the base canvas and return it.
+
+        Only the area the previous overlay (or final apply) touched is restored; ``bbox``
+        is what the step about to render may touch.
+        """
+
+        base = self._base_surface
+        buffer = self._overlay_buffer
+        dirty = self._overlay_dirty
+        if (
+            buffer is None
+            or buffer.get_size() != base.get_size()
+            or buffer.get_masks() != base.get_masks()
+        ):
+            buffer = self._overlay_buffer = base.copy()
+        elif dirty is None:
+            # Plan canvases are filled opaque before any step runs, so these blits are copies.
+            buffer.blit(base, (0, 0))
+        elif dirty:
+            buffer.blit(base, dirty.topleft, dirty)
+        self._overlay_dirty = bbox if bbox is not None else base.get_rect()
+        return buffer
 
     def _start_hold_timer(self, override: Optional[int] = None) -> None:
         duration = float(override) if override else float(self._settings.show_duration_sec)
-        self._holding_until = time.monotonic() + duration
+        self._holding_until_ms = self._frame_clock_ms + duration * 1000.0
+
+    def _hold_remaining_sec(self) -> float:
+        if self._holding_until_ms is None:
+            return 0.0
+        return max(0.0, (self._holding_until_ms - self._frame_clock_ms) / 1000.0)
 
     async def _refresh_preview(self) -> None:
-        self._queue_preview = await self._queue.preview(limit=5)
+        self._preview_version = self._queue.version
+        self._queue_preview = tuple(await self._queue.preview(limit=5))
         self._queue_length = await self._queue.size()
 
+    def _capture_state(self) -> RendererState:
+        self._state = RendererState(
+            active_task=self._active_task,
+            progress=self._compute_progress(),
+            hold_remaining=self._hold_remaining_sec(),
+            queue_preview=self._queue_preview,
+            fps=self._clock.get_fps(),
+        )
+        return self._state
+
     def _render_frame(self) -> None:
+        state = self._capture_state()
         if not self._display_surface or not self._hud:
             return
 
@@ -330,66 +470,96 @@ class RendererRuntime:
         if self._fallback_overlay is not None:
             scaled = self._fallback_overlay
         else:
-            scaled = upscale(active_surface, self._canvas_scale)
+            scaled = self._scaled_canvas(active_surface)
 
-        progress = self._compute_progress()
-        hold_remaining = max(0.0, (self._holding_until or 0) - time.monotonic()) if self._holding_until else 0.0
-        hold_total = float(
-            (self._active_task.hold_duration_sec if self._active_task else None)
-            or self._settings.show_duration_sec
-        )
         total_queue = self._queue_length + (1 if self._active_task else 0)
         hud_state = HUDState(
-            active_task=self._active_task,
-            progress=progress,
-            hold_remaining=hold_remaining,
-            hold_total=hold_total,
-            queue_preview=self._queue_preview,
+            active_task=state.active_task,
+            progress=state.progress,
+            hold_remaining=state.hold_remaining,
+            queue_preview=state.queue_preview,
             queue_length=total_queue,
             caption=self._caption,
-            fps=self._clock.get_fps(),
         )
 
-        if self._backdrop_surface:
-            self._display_surface.blit(self._backdrop_surface, (0, 0))
-        else:
-            self._display_surface.fill(self._shadow_color)
-        self._draw_canvas_frame()
-        self._display_surface.blit(scaled, self._canvas_rect)
+        # An unchanged static HUD is still on screen from the last frame, as is the canvas
+        # unless it changed; only the HUD's live widgets get repainted on top.
+        covered = self._hud.covers_background(
+            self._display_surface.get_size(), hud_state, self._canvas_rect
+        )
+        presented = self._presented_canvas
+        canvas_changed = (
+            presented is None or presented[0] is not scaled or presented[1] != self._canvas_version
+        )
+        if covered and not canvas_changed and self._hud.live_unchanged(hud_state):
+            # Nothing on screen would change (e.g. most frames of a hold), so skip the update.
+            return
+        # Backdrop, frame layers and canvas go out as one blits() call. Explicitly locking the
+        # display around them is not an option: pygame refuses to blit onto a locked surface.
+        blits: list[tuple] = []
+        if not covered:
+            if self._backdrop_surface:
+                blits.append((self._backdrop_surface, (0, 0)))
+            else:
+                self._display_surface.fill(self._shadow_color)
+            blits.extend(self._canvas_frame_blits())
+        if canvas_changed or not covered:
+            blits.append((scaled, self._canvas_rect))
+        if blits:
+            self._display_surface.blits(blits, doreturn=False)
+        self._presented_canvas = (scaled, self._canvas_version)
         self._hud.draw(self._display_surface, hud_state, self._canvas_rect)
-        pygame.display.flip()
+        if covered:
+            # Only the HUD's live widgets and possibly the canvas differ from the last frame.
+            dirty = [self._hud.dirty_rect]
+            if canvas_changed:
+                dirty.append(self._canvas_rect)
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
+
+    def _scaled_canvas(self, surface: pygame.Surface) -> pygame.Surface:
+        cached = self._scaled_cache
+        if cached is not None and cached[0] is surface and cached[1] == self._canvas_version:
+            return cached[2]
+        # Scale into the previous result's surface; it is only replaced when the format changes.
+        scaled = upscale(surface, self._canvas_scale, cached[2] if cached is not None else None)
+        self._scaled_cache = (surface, self._canvas_version, scaled)
+        return scaled
 
     def _compute_progress(self) -> float:
         if not self._active_task:
             return 0.0
         if self._active_task.content_type == RenderTaskType.TEXT:
             return 1.0
-        total = len(self._prepared_steps)
-        if total == 0:
+        # A handful of scalar operations once per frame: a numba/Cython kernel would cost more
+        # in call and boxing overhead than this spends in the interpreter.
+        total = len(self._step_progress)
+        if self._step_index >= total:
             return 1.0
-        completed = min(self._step_index, total)
-        fraction = completed / total
-        if self._step_index < total:
-            current = self._prepared_steps[self._step_index]
-            if current.timeline.duration_ms:
-                fraction += min(1.0, self._step_elapsed / current.timeline.duration_ms) / total
+        fraction = self._step_progress[self._step_index]
+        duration = self._step_durations[self._step_index]
+        if duration:
+            fraction += min(1.0, self._step_elapsed / duration) / total
         return min(1.0, fraction)
 
     def _complete_task(self, skipped: bool = False) -> None:
-        if self._task_done_pending:
-            self._queue.task_done()
-            self._task_done_pending = False
-
         self._active_task = None
+        self._prepared_plan = None
         self._prepared_steps = []
+        self._step_progress = []
+        self._step_delays = []
+        self._step_durations = []
         self._step_index = 0
         self._step_elapsed = 0.0
         self._step_delay = 0.0
-        self._holding_until = None
+        self._holding_until_ms = None
         self._drawing_complete = False
         self._caption = "All for you"
         self._base_surface.fill(self._bg_color)
-        self._frame_surface = self._base_surface.copy()
+        self._frame_surface = self._base_surface
+        self._overlay_dirty = None
+        self._canvas_version += 1
         self._skip_requested = False
         self._fallback_overlay = None
 
@@ -408,21 +578,24 @@ class RendererRuntime:
         top = max(header_offset, (window_height - canvas_px_h) // 2)
         self._canvas_rect = pygame.Rect(left, top, canvas_px_w, canvas_px_h)
         self._canvas_frame_rect = self._canvas_rect.inflate(48, 48)
-
-    def _build_backdrop_surface(self, width: int, height: int) -> pygame.Surface:
-        surface = pygame.Surface((width, height))
-        top = hex_to_rgb("#070A1E")
-        mid = hex_to_rgb("#101A3F")
-        bottom = hex_to_rgb("#061022")
-        for y in range(height):
-            t = y / max(1, height - 1)
-            if t < 0.55:
-                blend = t / 0.55
-                base = tuple(int(top[i] * (1 - blend) + mid[i] * blend) for i in range(3))
-            else:
-                blend = (t - 0.55) / 0.45
-                base = tuple(int(mid[i] * (1 - blend) + bottom[i] * blend) for i in range(3))
-            pygame.draw.line(surface, base, (0, y), (width, y))
+        self._canvas_frame_layers = None
+
+    @staticmethod
+    def _build_backdrop_surface(width: int, height: int) -> pygame.Surface:
+        top = np.array(hex_to_rgb("#070A1E"), dtype=np.float64)
+        mid = np.array(hex_to_rgb("#101A3F"), dtype=np.float64)
+        bottom = np.array(hex_to_rgb("#061022"), dtype=np.float64)
+        # Two-segment vertical gradient: one colour per row, written as a 1px column and
+        # stretched across the width (nearest-neighbour, so every row stays uniform).
+        t = np.arange(height) / max(1, height - 1)
+        upper = (t < 0.55)[:, None]
+        blend = np.where(upper, t[:, None] / 0.55, (t[:, None] - 0.55) / 0.45)
+        start = np.where(upper, top, mid)
+        end = np.where(upper, mid, bottom)
+        rows = (start * (1 - blend) + end * blend).astype(np.uint8)
+        column = pygame.Surface((1, height))
+        pygame.surfarray.blit_array(column, rows[None])
+        surface = pygame.transform.scale(column, (width, height))
 
         stripes = pygame.Surface((width, height), pygame.SRCALPHA)
         stripe_color = (*hex_to_rgb("#3C4FEE"), 26)
@@ -438,14 +611,18 @@ class RendererRuntime:
         surface.blit(stripes, (0, 0))
 
         aura = pygame.Surface((width, height), pygame.SRCALPHA)
-        center = (int(width * 0.22), int(height * 0.28))
+        aura.fill((*hex_to_rgb("#2334A3"), 0))
+        center_x, center_y = int(width * 0.22), int(height * 0.28)
         max_radius = int(max(width, height) * 0.8)
-        for radius in range(max_radius, 0, -20):
-            alpha = max(0, 140 - int(radius * 0.08))
-            if alpha <= 0:
-                continue
-            color = (*hex_to_rgb("#2334A3"), alpha)
-            pygame.draw.circle(aura, color, center, radius)
+        # Concentric 20px rings in one pass: each pixel takes the alpha of the smallest ring
+        # covering it. The half-pixel shift matches where pygame.draw.circle centres its spans.
+        dx = np.arange(width, dtype=np.float32) - center_x + 0.5
+        dy = np.arange(height, dtype=np.float32) - center_y + 0.5
+        distance = np.sqrt(dx[:, None] ** 2 + dy[None, :] ** 2)
+        rings = np.floor((max_radius - distance) / 20)
+        radius = max_radius - 20 * rings
+        alpha = np.where(rings >= 0, np.maximum(140 - (radius * 0.08).astype(np.int32), 0), 0)
+        pygame.surfarray.pixels_alpha(aura)[...] = alpha
         surface.blit(aura, (0, 0))
 
         vignette = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -454,21 +631,35 @@ class RendererRuntime:
         surface.blit(vignette, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
         return surface
 
-    def _draw_canvas_frame(self) -> None:
+    def _canvas_frame_blits(self) -> list[tuple[pygame.Surface, tuple[int, int], None, int]]:
+        if self._canvas_frame_layers is None:
+            self._canvas_frame_layers = self._build_canvas_frame_layers()
+        return self._canvas_frame_layers
+
+    def _build_canvas_frame_layers(self) -> list[tuple[pygame.Surface, tuple[int, int], None, int]]:
+        """Rasterize the glow, shadow and frame once; they blend over the backdrop in turn."""
+
         frame_rect = self._canvas_frame_rect
         glow_rect = frame_rect.inflate(40, 40)
         glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
         pygame.draw.rect(glow_surface, (*self._accent_color, 18), glow_surface.get_rect(), border_radius=90)
-        self._display_surface.blit(glow_surface, glow_rect.topleft, special_flags=pygame.BLEND_RGBA_ADD)
 
         shadow_rect = frame_rect.inflate(28, 28)
         shadow_surface = pygame.Surface(shadow_rect.size, pygame.SRCALPHA)
         pygame.draw.rect(shadow_surface, (5, 6, 12, 160), shadow_surface.get_rect(), border_radius=72)
-        self._display_surface.blit(shadow_surface, shadow_rect.topleft)
 
         frame_surface = pygame.Surface(frame_rect.size, pygame.SRCALPHA)
         pygame.draw.rect(frame_surface, (14, 18, 32, 220), frame_surface.get_rect(), border_radius=50)
         pygame.draw.rect(frame_surface, (*self._accent_color, 200), frame_surface.get_rect(), width=3, border_radius=50)
         inner = frame_surface.get_rect().inflate(-20, -20)
         pygame.draw.rect(frame_surface, (9, 11, 20, 240), inner, border_radius=40)
-        self._display_surface.blit(frame_surface, frame_rect.topleft)
+        # Reused on every frame the HUD is redrawn, so match the display's alpha format once.
+        if self._display_surface:
+            glow_surface = glow_surface.convert_alpha()
+            shadow_surface = shadow_surface.convert_alpha()
+            frame_surface = frame_surface.convert_alpha()
+        return [
+            (glow_surface, glow_rect.topleft, None, pygame.BLEND_RGBA_ADD),
+            (shadow_surface, shadow_rect.topleft, None, 0),
+            (frame_surface, frame_rect.topleft, None, 0),
+        ]
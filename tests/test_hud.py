@@ -0,0 +1,19 @@
+import os
+
+import pygame
+import pytest
+
+from draw_stream.renderer.hud import HudRenderer
+
+
+@pytest.fixture(scope="module")
+def hud() -> HudRenderer:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    return HudRenderer((1280, 720))
+
+
+def test_sanitize_masks_whole_words_only(hud: HudRenderer) -> None:
+    assert hud._sanitize_text("ты пидор, Pidor!") == "ты п**р, P**r!"
+    assert hud._sanitize_text("калека") == "к**а"
+    assert hud._sanitize_text("хачапури") == "хачапури"
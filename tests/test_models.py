@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from draw_stream.models import DonationEvent
+
+
+def make_event(**overrides) -> DonationEvent:
+    data = {
+        "id": "1",
+        "donor": "Tester",
+        "message": "Draw a cat",
+        "currency": "USD",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+    }
+    data.update(overrides)
+    return DonationEvent(**data)
+
+
+def test_donation_event_stores_minor_units() -> None:
+    event = make_event(amount="5.05")
+    assert event.amount_minor == 505
+    assert event.amount == Decimal("5.05")
+    assert str(event.amount) == "5.05"
+
+
+def test_donation_event_accepts_minor_units_directly() -> None:
+    event = make_event(amount_minor=1200)
+    assert event.amount == Decimal("12.00")
+
+
+@pytest.mark.parametrize("amount", ["5.00", "5.05", "1200.00"])
+def test_donation_event_amount_round_trips_input(amount: str) -> None:
+    assert str(make_event(amount=amount).amount) == amount
+
+
+@pytest.mark.parametrize(("amount", "shown"), [("5", "5.00"), ("5.5", "5.50")])
+def test_donation_event_amount_uses_currency_precision(amount: str, shown: str) -> None:
+    assert str(make_event(amount=amount).amount) == shown
+
+
+def test_donation_event_uses_currency_minor_units() -> None:
+    yen = make_event(amount="500", currency="JPY")
+    assert yen.amount_minor == 500
+    assert str(yen.amount) == "500"
+
+    dinar = make_event(amount="1.250", currency="KWD")
+    assert dinar.amount_minor == 1250
+    assert str(dinar.amount) == "1.250"
+
+
+@pytest.mark.parametrize("amount", ["abc", None, "inf", "-Infinity", "nan", "1e999999999", "0.001"])
+def test_donation_event_rejects_invalid_amounts(amount) -> None:
+    with pytest.raises(ValidationError):
+        make_event(amount=amount)
@@ -0,0 +1,111 @@
+import pytest
+from PIL import Image
+
+from draw_stream.artistry import pipeline as pipeline_module
+from draw_stream.artistry.pipeline import ArtPipeline
+from draw_stream.artistry.scene_planner import ScenePlannerError
+from draw_stream.canvas_dsl import CanvasDocument, CanvasSpec
+from draw_stream.models import DonationEvent, SceneDescription, ScenePlan
+from draw_stream.renderer.animations import StepPreparer
+
+from .utils import make_settings
+
+
+class _CountingPlanner:
+    def __init__(self, failures: int = 0) -> None:
+        self.calls = 0
+        self._failures = failures
+
+    async def describe(self, event: DonationEvent) -> ScenePlan:
+        self.calls += 1
+        if self.calls <= self._failures:
+            raise ScenePlannerError("planner unavailable")
+        return ScenePlan(approved=True, description=SceneDescription(prompt=event.message))
+
+    async def unload_model(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _StubGenerator:
+    async def generate(self, description: SceneDescription) -> Image.Image:
+        return Image.new("RGB", (4, 4), "#000000")
+
+
+class _StubBuilder:
+    def build(self, image: Image.Image) -> CanvasDocument:
+        return CanvasDocument(
+            version="1.0",
+            canvas=CanvasSpec(w=96, h=96, bg="#000000"),
+            caption="All for you",
+            render_text="stub",
+        )
+
+
+class _PixelsBuilder:
+    def build(self, image: Image.Image) -> CanvasDocument:
+        return CanvasDocument.model_validate(
+            {
+                "version": "1.0",
+                "canvas": {"w": 8, "h": 8, "bg": "#000000"},
+                "caption": "All for you",
+                "steps": [{"op": "pixels", "points": [[1, 1], [2, 3]], "color": "#FFFFFF"}],
+            }
+        )
+
+
+def _event(idx: int, message: str) -> DonationEvent:
+    return DonationEvent(
+        id=str(idx),
+        donor="Donor",
+        message=message,
+        amount="1.0",
+        currency="USD",
+        timestamp="2024-01-01T00:00:00+00:00",
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_message_reuses_cached_plan(monkeypatch) -> None:
+    monkeypatch.setattr(pipeline_module, "get_settings", lambda: make_settings(PLAN_CACHE_SIZE=1))
+    planner = _CountingPlanner()
+    pipeline = ArtPipeline(planner, _StubGenerator(), _StubBuilder())
+
+    first = await pipeline.create_plan(_event(1, "Draw a cat"))
+    second = await pipeline.create_plan(_event(2, "  draw A   CAT "))
+    assert planner.calls == 1
+    assert second == first and second is not first
+
+    await pipeline.create_plan(_event(3, "Draw a dog"))
+    await pipeline.create_plan(_event(4, "Draw a cat"))
+    assert planner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_plan_is_isolated_from_callers(monkeypatch) -> None:
+    monkeypatch.setattr(pipeline_module, "get_settings", lambda: make_settings(PLAN_CACHE_SIZE=4))
+    planner = _CountingPlanner()
+    pipeline = ArtPipeline(planner, _StubGenerator(), _PixelsBuilder())
+
+    first = await pipeline.create_plan(_event(1, "Draw stars"))
+    StepPreparer(first.canvas, 400).prepare_plan(first)
+    first.steps[0].points.append((5, 5))
+    first.caption = "changed"
+
+    second = await pipeline.create_plan(_event(2, "Draw stars"))
+    assert planner.calls == 1
+    assert second == _PixelsBuilder().build(Image.new("RGB", (1, 1)))
+
+
+@pytest.mark.asyncio
+async def test_planner_failure_is_not_cached(monkeypatch) -> None:
+    monkeypatch.setattr(pipeline_module, "get_settings", lambda: make_settings(PLAN_CACHE_SIZE=4))
+    planner = _CountingPlanner(failures=1)
+    pipeline = ArtPipeline(planner, _StubGenerator(), _StubBuilder())
+
+    await pipeline.create_plan(_event(1, "Draw a cat"))
+    await pipeline.create_plan(_event(2, "Draw a cat"))
+    await pipeline.create_plan(_event(3, "Draw a cat"))
+    assert planner.calls == 2
@@ -29,8 +29,6 @@ async def test_queue_preserves_order() -> None:
     out2 = await queue.dequeue()
     assert out1.event.id == "0"
     assert out2.event.id == "1"
-    queue.task_done()
-    queue.task_done()
 
 
 @pytest.mark.asyncio
@@ -43,7 +41,52 @@ async def test_queue_preview() -> None:
     assert [task.event.id for task in preview] == ["0", "1", "2"]
 
     await queue.dequeue()
-    queue.task_done()
     preview = await queue.preview(limit=2)
     assert [task.event.id for task in preview] == ["1", "2"]
 
+
+@pytest.mark.asyncio
+async def test_queue_enqueue_waits_for_capacity() -> None:
+    queue = QueueManager(max_size=1)
+    await queue.enqueue(_make_task(0))
+
+    pending = asyncio.create_task(queue.enqueue(_make_task(1)))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    assert (await queue.dequeue()).event.id == "0"
+    await asyncio.wait_for(pending, timeout=1)
+    assert await queue.size() == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_version_tracks_mutations() -> None:
+    queue = QueueManager(max_size=10)
+    start = queue.version
+
+    await queue.enqueue(_make_task(0))
+    await queue.preview()
+    await queue.size()
+    assert queue.version == start + 1
+
+    await queue.dequeue()
+    assert queue.version == start + 2
+
+
+@pytest.mark.asyncio
+async def test_queue_batch_order() -> None:
+    queue = QueueManager(max_size=2)
+    producer = asyncio.create_task(queue.enqueue_many(_make_task(i) for i in range(5)))
+
+    received = []
+    while len(received) < 5:
+        received.extend(await asyncio.wait_for(queue.dequeue_up_to(3), timeout=1))
+    await asyncio.wait_for(producer, timeout=1)
+
+    assert [task.event.id for task in received] == ["0", "1", "2", "3", "4"]
+    assert await queue.size() == 0
+
+    version = queue.version
+    with pytest.raises(ValueError):
+        await queue.dequeue_up_to(0)
+    assert queue.version == version